@@ -0,0 +1,379 @@
+"""Threshold alerts over the monitor's samples.
+
+Rules are one line each:
+
+    cpu > 90 for 30s
+    swap_in_rate > 1024 for 10s clear 256
+    fd > 80
+    rate(proc.rss) > 5 for 2m smooth 30s
+
+i.e. `[rate(]metric[)] op threshold [for DURATION] [clear LEVEL] [smooth DURATION]`.
+A rule fires once the condition has held for DURATION and clears only when
+the value gets back past LEVEL (by default 5% of the threshold beyond it),
+so a value hovering at the threshold does not flap. rate() turns a value
+into its per-second change and smooth applies an EWMA with that time
+constant.
+
+Metrics starting with "proc." are evaluated for every process. Rate and
+smoothing are computed once per distinct series and shared by every rule
+reading it; a rule only keeps state for subjects that are currently
+breaching or firing, and subjects below every threshold of a series are
+skipped with two comparisons.
+
+The config file holds rules plus sink lines: `notify` (desktop
+notification), `log PATH` and `hook COMMAND`. Blank lines and # comments
+are ignored.
+"""
+import math
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from collectors import SYSTEM_METRICS, DEVICE_METRIC_SUFFIXES, CLK_TCK
+
+ALERTS_CONFIG = os.path.expanduser("~/.config/linux-monitor/alerts.conf")
+
+# Used when there is no config file
+DEFAULT_RULES = (
+    "cpu > 90 for 30s",
+    "mem > 90 for 30s",
+    "swap_in_rate > 1024 for 10s",
+    "fd > 80",
+)
+
+# Fraction of the threshold between the firing and clearing levels
+DEFAULT_HYSTERESIS = 0.05
+
+# Metric names rules may use: collectors.SYSTEM_METRICS, the per-NIC/disk
+# rates from BatchReader.device_metrics ("eth0.rx_mbps", "sda.write_mbps",
+# ...) and what process_metrics produces
+PROCESS_METRICS = {'proc.cpu', 'proc.rss', 'proc.io'}
+
+# Per-process counters; rules on these always see the per-second rate
+# (proc.cpu: % of one core, proc.io: KB/s)
+COUNTER_METRICS = {'proc.cpu', 'proc.io'}
+
+RULE_RE = re.compile(r"""
+    ^\s*(?:(rate)\(\s*([\w.-]+)\s*\)|([\w.-]+))
+    \s*(>=|<=|>|<)\s*(-?\d+(?:\.\d+)?)\s*%?
+    (?:\s+for\s+(\d+(?:\.\d+)?)\s*([smh]?))?
+    (?:\s+clear\s+(-?\d+(?:\.\d+)?)\s*%?)?
+    (?:\s+smooth\s+(\d+(?:\.\d+)?)\s*([smh]?))?
+    \s*$""", re.X)
+
+UNIT_SECONDS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+AlertEvent = namedtuple('AlertEvent', ['time', 'state', 'rule', 'pid', 'name', 'value'])
+
+def known_metric(name):
+    return name in SYSTEM_METRICS or name in PROCESS_METRICS or name.endswith(DEVICE_METRIC_SUFFIXES)
+
+def duration_seconds(value, unit):
+    return float(value) * UNIT_SECONDS[unit] if value else 0.0
+
+class RuleState:
+    __slots__ = ('since', 'active', 'value')
+
+    def __init__(self, since):
+        self.since = since
+        self.active = False
+        self.value = 0.0
+
+class Rule:
+    """One parsed rule and the state of the subjects it is tracking."""
+
+    def __init__(self, text):
+        match = RULE_RE.match(text)
+        if match is None:
+            raise ValueError(f"invalid alert rule: {text!r}")
+        (rate, rate_metric, metric, op, threshold, duration, duration_unit,
+         clear, smooth, smooth_unit) = match.groups()
+
+        self.text = " ".join(text.split())
+        self.metric = rate_metric or metric
+        if not known_metric(self.metric):
+            raise ValueError(f"unknown metric {self.metric!r} in alert rule: {text!r}")
+        self.rate = bool(rate) or self.metric in COUNTER_METRICS
+        self.above = op in ('>', '>=')
+        self.inclusive = op in ('>=', '<=')
+        self.threshold = float(threshold)
+        self.duration = duration_seconds(duration, duration_unit)
+        self.smooth = duration_seconds(smooth, smooth_unit)
+        self.per_process = self.metric.startswith('proc.')
+
+        band = abs(self.threshold) * DEFAULT_HYSTERESIS
+        if clear is None:
+            self.clear = self.threshold - band if self.above else self.threshold + band
+        else:
+            self.clear = float(clear)
+            if (self.clear > self.threshold) if self.above else (self.clear < self.threshold):
+                raise ValueError(f"clear level is on the wrong side of the threshold: {text!r}")
+
+        # subject key (None for system metrics, else (pid, start time)) -> RuleState,
+        # only while breaching or firing
+        self.states = {}
+
+    @property
+    def series_key(self):
+        return (self.metric, self.rate, self.smooth)
+
+    def breached(self, value):
+        if self.above:
+            return value >= self.threshold if self.inclusive else value > self.threshold
+        return value <= self.threshold if self.inclusive else value < self.threshold
+
+    def recovered(self, value):
+        if self.breached(value):
+            return False
+        return value <= self.clear if self.above else value >= self.clear
+
+    def step(self, key, value, now, group, events):
+        state = self.states.get(key)
+        if state is None:
+            if not self.breached(value):
+                return
+            state = self.states[key] = RuleState(now)
+            group.tracked[key] = group.tracked.get(key, 0) + 1
+        state.value = value
+
+        if state.active:
+            if self.recovered(value):
+                self.release(key, group)
+                events.append(('cleared', self, key, value))
+        elif self.breached(value):
+            if now - state.since >= self.duration:
+                state.active = True
+                events.append(('fired', self, key, value))
+        else:
+            # Dropped back before the duration was reached
+            self.release(key, group)
+
+    def drop(self, key, group, events):
+        """The subject is gone (process exited or metric unavailable)."""
+        state = self.states.get(key)
+        if state is not None:
+            if state.active:
+                events.append(('cleared', self, key, state.value))
+            self.release(key, group)
+
+    def release(self, key, group):
+        del self.states[key]
+        if group.tracked[key] == 1:
+            del group.tracked[key]
+        else:
+            group.tracked[key] -= 1
+
+class Series:
+    """A metric as rules see it: raw, or rate of change, optionally EWMA smoothed."""
+
+    def __init__(self, metric, rate, smooth):
+        self.metric = metric
+        self.rate = rate
+        self.smooth = smooth
+        self.prev = {}  # key -> [raw value, time, derived value]
+
+    def update(self, values, now):
+        if not self.rate and not self.smooth:
+            return values
+        prev = self.prev
+        derived = {}
+        for key, raw in values.items():
+            entry = prev.get(key)
+            if entry is None:
+                # A rate needs two samples; a smoothed raw value starts at itself
+                prev[key] = [raw, now, None if self.rate else raw]
+                if not self.rate:
+                    derived[key] = raw
+                continue
+            dt = now - entry[1]
+            if dt <= 0:
+                if entry[2] is not None:
+                    derived[key] = entry[2]
+                continue
+            value = (raw - entry[0]) / dt if self.rate else raw
+            if self.smooth and entry[2] is not None:
+                value = entry[2] + (1 - math.exp(-dt / self.smooth)) * (value - entry[2])
+            entry[0], entry[1], entry[2] = raw, now, value
+            derived[key] = value
+        # Every current key is in prev now, so a size mismatch means some are gone
+        if len(prev) > len(values):
+            for key in [key for key in prev if key not in values]:
+                del prev[key]
+        return derived
+
+class RuleGroup:
+    """The rules reading one series."""
+
+    def __init__(self, series, rules):
+        self.series = series
+        self.rules = rules
+        self.per_process = rules[0].per_process
+        # Values strictly between these cannot breach any rule in the group
+        self.lowest_upper = min((r.threshold for r in rules if r.above), default=math.inf)
+        self.highest_lower = max((r.threshold for r in rules if not r.above), default=-math.inf)
+        self.tracked = {}  # key -> number of rules holding state for it
+
+    def evaluate(self, values, now, events):
+        values = self.series.update(values, now)
+        upper, lower, tracked = self.lowest_upper, self.highest_lower, self.tracked
+        for key, value in values.items():
+            if value >= upper or value <= lower or key in tracked:
+                for rule in self.rules:
+                    rule.step(key, value, now, self, events)
+        if tracked:
+            for key in [key for key in tracked if key not in values]:
+                for rule in self.rules:
+                    rule.drop(key, self, events)
+
+class AlertEngine:
+    """Evaluates rules against each new sample and sends changes to the sinks."""
+
+    def __init__(self, rules, sinks=()):
+        self.rules = [rule if isinstance(rule, Rule) else Rule(rule) for rule in rules]
+        self.sinks = list(sinks)
+        grouped = {}
+        for rule in self.rules:
+            grouped.setdefault(rule.series_key, []).append(rule)
+        self.groups = [RuleGroup(Series(*key), rules) for key, rules in grouped.items()]
+        self.needs_processes = any(rule.per_process for rule in self.rules)
+
+    def evaluate(self, metrics, process_metrics=None, names=None, now=None):
+        """metrics: {name: value}; process_metrics: {name: {(pid, start time): value}};
+        names: {pid: name}.
+
+        Returns the AlertEvents (fired or cleared) produced by this sample.
+        """
+        now = time.monotonic() if now is None else now
+        changes = []
+        for group in self.groups:
+            metric = group.series.metric
+            if group.per_process:
+                values = (process_metrics or {}).get(metric, {})
+            else:
+                value = metrics.get(metric)
+                values = {} if value is None else {None: value}
+            group.evaluate(values, now, changes)
+
+        events = []
+        if changes:
+            stamp = time.time()
+            names = names or {}
+            for state, rule, key, value in changes:
+                pid = None if key is None else key[0]
+                event = AlertEvent(stamp, state, rule, pid, names.get(pid, ""), value)
+                events.append(event)
+                for sink in self.sinks:
+                    sink.send(event)
+        return events
+
+    def active(self):
+        """[(rule, pid, value)] for every alert currently firing."""
+        return [(rule, None if key is None else key[0], state.value)
+                for rule in self.rules for key, state in rule.states.items() if state.active]
+
+def format_alert(rule, pid, name, value):
+    subject = f" [{name or 'pid'} {pid}]" if pid is not None else ""
+    return f"{rule.text}{subject}: now {value:,.2f}"
+
+def format_event(event):
+    label = "ALERT" if event.state == 'fired' else "CLEARED"
+    return f"{label} {format_alert(event.rule, event.pid, event.name, event.value)}"
+
+# --- SINKS ---
+class LogSink:
+    """Appends one line per event to a file."""
+
+    def __init__(self, path):
+        self.file = open(os.path.expanduser(path), 'a', buffering=1)
+
+    def send(self, event):
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(event.time))
+        self.file.write(f"{stamp} {format_event(event)}\n")
+
+class CommandSink:
+    """Runs a hook command per event without waiting for it.
+
+    The event is passed in ALERT_STATE, ALERT_RULE, ALERT_METRIC,
+    ALERT_VALUE, ALERT_PID, ALERT_NAME and ALERT_MESSAGE.
+    """
+
+    def __init__(self, command):
+        self.argv = shlex.split(command)
+        self.children = []
+
+    def run(self, argv, env=None):
+        # Reap finished hooks so they don't linger as zombies
+        self.children = [child for child in self.children if child.poll() is None]
+        try:
+            self.children.append(subprocess.Popen(argv, env=env, stdin=subprocess.DEVNULL,
+                                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        except OSError as e:
+            print(f"alerts: cannot run {argv[0]}: {e}", file=sys.stderr)
+
+    def send(self, event):
+        env = dict(os.environ,
+                   ALERT_STATE=event.state, ALERT_RULE=event.rule.text, ALERT_METRIC=event.rule.metric,
+                   ALERT_VALUE=f"{event.value:.2f}", ALERT_PID="" if event.pid is None else str(event.pid),
+                   ALERT_NAME=event.name, ALERT_MESSAGE=format_event(event))
+        self.run(self.argv, env)
+
+class DesktopSink(CommandSink):
+    """Desktop notifications through notify-send, if it is installed."""
+
+    def __init__(self):
+        super().__init__("notify-send")
+        self.available = shutil.which("notify-send") is not None
+
+    def send(self, event):
+        if not self.available:
+            return
+        urgency = "critical" if event.state == 'fired' else "normal"
+        self.run(self.argv + ["-u", urgency, "-a", "System Monitor",
+                              "Alert" if event.state == 'fired' else "Alert cleared", format_event(event)])
+
+def load_alert_config(path=ALERTS_CONFIG):
+    """Rules and sinks from a config file, or the default rules if it doesn't exist."""
+    if not os.path.exists(path):
+        return list(DEFAULT_RULES), []
+    rules, sinks = [], []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            keyword, _, argument = line.partition(' ')
+            try:
+                if keyword == 'notify':
+                    sinks.append(DesktopSink())
+                elif keyword == 'log':
+                    sinks.append(LogSink(argument.strip()))
+                elif keyword == 'hook':
+                    sinks.append(CommandSink(argument.strip()))
+                else:
+                    rules.append(Rule(line))
+            except (ValueError, OSError) as e:
+                print(f"alerts: {path}:{number}: {e}", file=sys.stderr)
+    return rules, sinks
+
+# --- METRICS ---
+def process_metrics(stats):
+    """({metric: {(pid, start time): value}}, {pid: name}) from get_process_stats output.
+
+    Series are keyed with the start time so a reused PID starts a new series
+    instead of being diffed or smoothed against its predecessor. proc.cpu and
+    proc.io are cumulative here (in %-seconds and KB); rules see their
+    per-second rate. proc.rss is in MB.
+    """
+    cpu, rss, io, names = {}, {}, {}, {}
+    cpu_scale = 100.0 / CLK_TCK
+    for pid, (ppid, name, state, cpu_ticks, rss_kb, io_bytes, start_time) in stats.items():
+        key = (pid, start_time)
+        cpu[key] = cpu_ticks * cpu_scale
+        rss[key] = rss_kb / 1024
+        io[key] = io_bytes / 1024
+        names[pid] = name
+    return {'proc.cpu': cpu, 'proc.rss': rss, 'proc.io': io}, names
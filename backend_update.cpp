@@ -6,6 +6,10 @@
 #include <unistd.h>
 #include <map>
 #include <dirent.h>
+#include <ctime>
+#include <cstring>
+#include <cstdlib>
+#include <fcntl.h>
 
 using namespace std;
 
@@ -29,18 +33,61 @@ extern "C" {
         long long tx_packets;
         long long rx_errors;
         long long tx_errors;
+        double sampled; // monotonic seconds when the counters were read
     };
 
     struct DiskIOStats {
         long long read_bytes;
         long long write_bytes;
+        double sampled;
+    };
+
+    // Fields filled by get_meminfo_fields, in array order. Callers look the
+    // order up through get_meminfo_field_name instead of hardcoding it.
+    static const char* MEMINFO_KEYS[] = {
+        "MemTotal", "MemFree", "MemAvailable", "Buffers", "Cached", "SwapCached",
+        "Active", "Inactive", "Active(anon)", "Inactive(anon)", "Active(file)", "Inactive(file)",
+        "Unevictable", "Mlocked", "SwapTotal", "SwapFree", "Dirty", "Writeback",
+        "AnonPages", "Mapped", "Shmem", "KReclaimable", "Slab", "SReclaimable", "SUnreclaim",
+        "KernelStack", "PageTables", "CommitLimit", "Committed_AS", "VmallocUsed",
+        "AnonHugePages", "HugePages_Total", "HugePages_Free", "Hugepagesize",
+    };
+    static const int MEMINFO_COUNT = sizeof(MEMINFO_KEYS) / sizeof(MEMINFO_KEYS[0]);
+
+    // Counters reported by get_vmstat_rates, in array order
+    static const char* VMSTAT_KEYS[] = {
+        "pgfault", "pgmajfault", "pswpin", "pswpout", "oom_kill",
+    };
+    static const int VMSTAT_COUNT = sizeof(VMSTAT_KEYS) / sizeof(VMSTAT_KEYS[0]);
+
+    struct ProcTimeEntry {
+        long long total;
+        time_t last_seen;
+        double sampled;
     };
 
     // Static variables to hold state between updates
     static CpuStats prev_cpu_stats = {0};
-    static map<int, long long> prev_proc_times;
+    // Shared by processes and threads. Process keys are the plain PID, thread
+    // keys carry the TID in the high bits (see thread_key) so a main thread
+    // never collides with its process.
+    static map<long long, ProcTimeEntry> prev_proc_times;
+    static const size_t MAX_PROC_TIME_ENTRIES = 32768;
+    static const time_t PROC_TIME_TTL = 10; // seconds without a reading before an entry is dropped
     static map<string, NetworkStats> prev_net_stats;
     static map<string, DiskIOStats> prev_disk_stats;
+    static long long prev_vmstat[VMSTAT_COUNT] = {0};
+    static double prev_vmstat_time = 0.0;
+
+    // Previous counter matrix for /proc/interrupts (0) and /proc/softirqs (1)
+    struct IrqMatrixState {
+        vector<long long> counts;
+        vector<string> labels;
+        vector<int> cpu_ids; // CPU number of each column; changes when a CPU goes on/offline
+        int stride;          // buffer width (max_cpus) the counts were stored with
+        double time;
+    };
+    static IrqMatrixState prev_irq[2];
 
     // --- FUNCTION 1: UPTIME ---
     double get_uptime_seconds() {
@@ -56,28 +103,93 @@ extern "C" {
         return uptime_seconds;
     }
 
-    // --- FUNCTION 2: MEMORY ---
-    void get_memory_usage(long* total_k, long* free_k) {
-        ifstream memInfo("/proc/meminfo");
-        string line;
-        *total_k = 0;
-        *free_k = 0;
-
-        if (memInfo.is_open()) {
-            while (getline(memInfo, line)) {
-                if (line.find("MemTotal:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *total_k = stol(val);
-                }
-                else if (line.find("MemAvailable:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *free_k = stol(val);
+    // --- HELPERS: KEY/VALUE PROC FILES ---
+    // Reads a small proc file in one read() call. Returns the length, or -1.
+    static int read_proc_file(const char* path, char* buf, int size) {
+        int fd = open(path, O_RDONLY);
+        if (fd < 0) return -1;
+        int len = 0;
+        ssize_t n;
+        while (len < size - 1 && (n = read(fd, buf + len, size - 1 - len)) > 0) {
+            len += n;
+        }
+        close(fd);
+        buf[len] = '\0';
+        return len;
+    }
+
+    // Parses "key<sep>value" lines, storing each value whose key is in keys[]
+    // at the same index of out[]. Fields that are missing stay at -1.
+    static void parse_key_values(char* buf, char sep, const char** keys, int count, long long* out) {
+        for (int i = 0; i < count; i++) out[i] = -1;
+
+        char* line = buf;
+        while (line && *line) {
+            char* next = strchr(line, '\n');
+            if (next) *next++ = '\0';
+
+            char* end = strchr(line, sep);
+            if (end) {
+                size_t key_len = end - line;
+                for (int i = 0; i < count; i++) {
+                    if (out[i] == -1 && strlen(keys[i]) == key_len && strncmp(line, keys[i], key_len) == 0) {
+                        out[i] = strtoll(end + 1, nullptr, 10);
+                        break;
+                    }
                 }
             }
-            memInfo.close();
+            line = next;
+        }
+    }
+
+    static int meminfo_index(const char* key) {
+        for (int i = 0; i < MEMINFO_COUNT; i++) {
+            if (strcmp(MEMINFO_KEYS[i], key) == 0) return i;
         }
+        return -1;
+    }
+
+    // --- FUNCTION 2: MEMINFO (ALL FIELDS, ONE PASS) ---
+    int get_meminfo_field_count() {
+        return MEMINFO_COUNT;
+    }
+
+    const char* get_meminfo_field_name(int index) {
+        if (index < 0 || index >= MEMINFO_COUNT) return nullptr;
+        return MEMINFO_KEYS[index];
+    }
+
+    // Fills out[MEMINFO_COUNT] with the /proc/meminfo values (kB, or pages for
+    // the HugePages counts). Missing fields are 0; MemAvailable is estimated on
+    // kernels older than 3.14 that don't report it.
+    void get_meminfo_fields(long long* out) {
+        char buf[8192];
+        if (read_proc_file("/proc/meminfo", buf, sizeof(buf)) < 0) {
+            for (int i = 0; i < MEMINFO_COUNT; i++) out[i] = 0;
+            return;
+        }
+        parse_key_values(buf, ':', MEMINFO_KEYS, MEMINFO_COUNT, out);
+
+        static const int available = meminfo_index("MemAvailable");
+        if (out[available] == -1) {
+            long long estimate = 0;
+            for (const char* key : {"MemFree", "Buffers", "Cached"}) {
+                long long value = out[meminfo_index(key)];
+                if (value > 0) estimate += value;
+            }
+            out[available] = estimate;
+        }
+        for (int i = 0; i < MEMINFO_COUNT; i++) {
+            if (out[i] < 0) out[i] = 0;
+        }
+    }
+
+    // --- FUNCTION 2b: MEMORY (TOTAL / AVAILABLE) ---
+    void get_memory_usage(long* total_k, long* free_k) {
+        long long fields[MEMINFO_COUNT];
+        get_meminfo_fields(fields);
+        *total_k = fields[meminfo_index("MemTotal")];
+        *free_k = fields[meminfo_index("MemAvailable")];
     }
 
     // --- FUNCTION 3: TOTAL CPU USAGE ---
@@ -117,47 +229,106 @@ extern "C" {
         return percentage;
     }
 
-    // --- FUNCTION 4: PER-PROCESS CPU USAGE ---
-    double get_process_cpu_usage(int pid) {
-        ifstream f("/proc/" + to_string(pid) + "/stat");
-        if (!f.is_open()) return 0.0;
+    // Rates divide by the time actually elapsed between two readings, so
+    // callers may sample at any interval
+    static double monotonic_seconds() {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return ts.tv_sec + ts.tv_nsec / 1e9;
+    }
 
-        string tmp;
-        long long utime, stime;
-        
-        // Skip to fields 14 and 15 (utime and stime)
-        for (int i = 0; i < 13; i++) f >> tmp;
-        f >> utime >> stime;
+    // --- HELPERS: SHARED CPU DELTA TABLE ---
+    static long long thread_key(int pid, int tid) {
+        return ((long long)tid << 32) | (unsigned int)pid;
+    }
+
+    // Reads utime + stime from a /proc stat file. The command name may contain
+    // spaces, so fields are counted from the closing parenthesis.
+    static bool read_stat_cpu_time(const string& path, long long* total) {
+        ifstream f(path);
+        if (!f.is_open()) return false;
+
+        string line;
+        getline(f, line);
         f.close();
 
-        long long total = utime + stime;
-        
-        // Get previous time for this process
-        long long prev_time = 0;
-        if (prev_proc_times.find(pid) != prev_proc_times.end()) {
-            prev_time = prev_proc_times[pid];
+        size_t last_paren = line.rfind(')');
+        if (last_paren == string::npos) return false;
+
+        istringstream ss(line.substr(last_paren + 1));
+        string tmp;
+        long long utime = 0, stime = 0;
+        // Skip fields 3..13, then read fields 14 and 15 (utime and stime)
+        for (int i = 0; i < 11; i++) ss >> tmp;
+        if (!(ss >> utime >> stime)) return false;
+
+        *total = utime + stime;
+        return true;
+    }
+
+    // Drops entries for tasks that have not been read recently once the table
+    // reaches its cap, so exited processes and threads don't accumulate.
+    static void prune_proc_times(time_t now) {
+        if (prev_proc_times.size() < MAX_PROC_TIME_ENTRIES) return;
+
+        for (auto it = prev_proc_times.begin(); it != prev_proc_times.end(); ) {
+            if (now - it->second.last_seen > PROC_TIME_TTL) {
+                it = prev_proc_times.erase(it);
+            } else {
+                ++it;
+            }
         }
-        
-        // Calculate delta
-        long long delta = total - prev_time;
-        
-        // Store current time for next iteration
-        prev_proc_times[pid] = total;
-        
-        // Convert to percentage (delta is in jiffies, divide by time period in jiffies)
-        // Assuming 1 second update interval and using sysconf to get clock ticks per second
+        if (prev_proc_times.size() >= MAX_PROC_TIME_ENTRIES) {
+            prev_proc_times.clear();
+        }
+    }
+
+    static double cpu_delta_percentage(long long key, long long total) {
+        time_t now = time(nullptr);
+        double sampled = monotonic_seconds();
+        prune_proc_times(now);
+
+        auto it = prev_proc_times.find(key);
+        if (it == prev_proc_times.end()) {
+            // First reading: no delta yet
+            prev_proc_times[key] = {total, now, sampled};
+            return 0.0;
+        }
+
+        // Calculate delta and store current time for next iteration
+        long long delta = total - it->second.total;
+        double elapsed = sampled - it->second.sampled;
+        it->second = {total, now, sampled};
+        if (elapsed <= 0) return 0.0;
+
+        // Convert to percentage (delta is in jiffies, divide by the elapsed time in jiffies)
         long hz = sysconf(_SC_CLK_TCK);
         if (hz <= 0) hz = 100; // fallback
-        
-        double percentage = (double)delta / hz * 100.0;
-        
+
+        double percentage = (double)delta / hz / elapsed * 100.0;
+
         // Cap at reasonable value (some processes might spike)
         if (percentage > 100.0) percentage = 100.0;
         if (percentage < 0.0) percentage = 0.0;
-        
+
         return percentage;
     }
 
+    // --- FUNCTION 4: PER-PROCESS CPU USAGE ---
+    double get_process_cpu_usage(int pid) {
+        long long total = 0;
+        if (!read_stat_cpu_time("/proc/" + to_string(pid) + "/stat", &total)) return 0.0;
+        return cpu_delta_percentage(pid, total);
+    }
+
+    // --- FUNCTION 4b: PER-THREAD CPU USAGE ---
+    double get_thread_cpu_usage(int pid, int tid) {
+        long long total = 0;
+        string path = "/proc/" + to_string(pid) + "/task/" + to_string(tid) + "/stat";
+        if (!read_stat_cpu_time(path, &total)) return 0.0;
+        return cpu_delta_percentage(thread_key(pid, tid), total);
+    }
+
     // --- FUNCTION 5: PER-PROCESS MEMORY ---
     long get_process_memory_mb(int pid) {
         ifstream f("/proc/" + to_string(pid) + "/status");
@@ -186,56 +357,19 @@ extern "C" {
 
     // --- FUNCTION 7: SWAP USAGE ---
     void get_swap_usage(long* total_k, long* free_k) {
-        ifstream memInfo("/proc/meminfo");
-        string line;
-        *total_k = 0;
-        *free_k = 0;
-
-        if (memInfo.is_open()) {
-            while (getline(memInfo, line)) {
-                if (line.find("SwapTotal:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *total_k = stol(val);
-                }
-                else if (line.find("SwapFree:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *free_k = stol(val);
-                }
-            }
-            memInfo.close();
-        }
+        long long fields[MEMINFO_COUNT];
+        get_meminfo_fields(fields);
+        *total_k = fields[meminfo_index("SwapTotal")];
+        *free_k = fields[meminfo_index("SwapFree")];
     }
 
     // --- FUNCTION 8: MEMORY BREAKDOWN ---
     void get_memory_breakdown(long* cached_k, long* buffers_k, long* shared_k) {
-        ifstream memInfo("/proc/meminfo");
-        string line;
-        *cached_k = 0;
-        *buffers_k = 0;
-        *shared_k = 0;
-
-        if (memInfo.is_open()) {
-            while (getline(memInfo, line)) {
-                if (line.find("Cached:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *cached_k = stol(val);
-                }
-                else if (line.find("Buffers:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *buffers_k = stol(val);
-                }
-                else if (line.find("Shmem:") == 0) {
-                    string val = line.substr(line.find(":") + 1);
-                    val = val.substr(0, val.find("kB"));
-                    *shared_k = stol(val);
-                }
-            }
-            memInfo.close();
-        }
+        long long fields[MEMINFO_COUNT];
+        get_meminfo_fields(fields);
+        *cached_k = fields[meminfo_index("Cached")];
+        *buffers_k = fields[meminfo_index("Buffers")];
+        *shared_k = fields[meminfo_index("Shmem")];
     }
 
     // --- FUNCTION 9: IO WAIT PERCENTAGE ---
@@ -302,28 +436,62 @@ extern "C" {
         if (tx_e.is_open()) tx_e >> *tx_errors;
     }
 
-    // --- FUNCTION 12: NETWORK THROUGHPUT ---
-    void get_network_throughput(const char* interface, double* rx_mbps, double* tx_mbps) {
-        long long rx_bytes = 0, tx_bytes = 0, rx_packets = 0, tx_packets = 0, rx_errors = 0, tx_errors = 0;
-        get_network_stats(interface, &rx_bytes, &tx_bytes, &rx_packets, &tx_packets, &rx_errors, &tx_errors);
-        
-        NetworkStats curr = {rx_bytes, tx_bytes, rx_packets, tx_packets, rx_errors, tx_errors};
-        string iface(interface);
-        
-        if (prev_net_stats.find(iface) != prev_net_stats.end()) {
-            NetworkStats& prev = prev_net_stats[iface];
+    // Throughput since the previous reading of the same interface
+    static void network_throughput_delta(const string& iface, const NetworkStats& curr,
+                                         double* rx_mbps, double* tx_mbps) {
+        double now = monotonic_seconds();
+        auto it = prev_net_stats.find(iface);
+        if (it != prev_net_stats.end() && now > it->second.sampled) {
+            NetworkStats& prev = it->second;
             long long rx_delta = curr.rx_bytes - prev.rx_bytes;
             long long tx_delta = curr.tx_bytes - prev.tx_bytes;
+            double elapsed = now - prev.sampled;
             
             // Convert to Mbps (bytes per second * 8 / 1,000,000)
-            *rx_mbps = (rx_delta * 8.0) / 1000000.0;
-            *tx_mbps = (tx_delta * 8.0) / 1000000.0;
+            *rx_mbps = (rx_delta * 8.0) / 1000000.0 / elapsed;
+            *tx_mbps = (tx_delta * 8.0) / 1000000.0 / elapsed;
         } else {
             *rx_mbps = 0.0;
             *tx_mbps = 0.0;
         }
         
         prev_net_stats[iface] = curr;
+        prev_net_stats[iface].sampled = now;
+    }
+
+    // --- FUNCTION 12: NETWORK THROUGHPUT ---
+    void get_network_throughput(const char* interface, double* rx_mbps, double* tx_mbps) {
+        NetworkStats curr = {0, 0, 0, 0, 0, 0};
+        get_network_stats(interface, &curr.rx_bytes, &curr.tx_bytes, &curr.rx_packets, &curr.tx_packets,
+                          &curr.rx_errors, &curr.tx_errors);
+        network_throughput_delta(interface, curr, rx_mbps, tx_mbps);
+    }
+
+    // Splits a newline-separated name list into exactly count entries
+    static vector<string> split_names(const char* names, int count) {
+        vector<string> result(count);
+        const char* start = names;
+        for (int i = 0; i < count && start; i++) {
+            const char* end = strchr(start, '\n');
+            result[i] = end ? string(start, end - start) : string(start);
+            start = end ? end + 1 : nullptr;
+        }
+        return result;
+    }
+
+    // --- FUNCTION 12b: ALL INTERFACES IN ONE CALL ---
+    // names is a newline-separated list of count interfaces. counters gets six
+    // values per interface in get_network_stats order, mbps gets rx/tx pairs.
+    // Each statistics file is read once and feeds both outputs.
+    void get_network_batch(const char* names, int count, long long* counters, double* mbps) {
+        vector<string> ifaces = split_names(names, count);
+        for (int i = 0; i < count; i++) {
+            long long* c = counters + i * 6;
+            c[0] = c[1] = c[2] = c[3] = c[4] = c[5] = 0;
+            get_network_stats(ifaces[i].c_str(), &c[0], &c[1], &c[2], &c[3], &c[4], &c[5]);
+            NetworkStats curr = {c[0], c[1], c[2], c[3], c[4], c[5]};
+            network_throughput_delta(ifaces[i], curr, &mbps[i * 2], &mbps[i * 2 + 1]);
+        }
     }
 
     // --- FUNCTION 13: CPU TEMPERATURE ---
@@ -421,6 +589,13 @@ extern "C" {
         return -1.0;
     }
 
+    // --- FUNCTION 17b: ALL CORE FREQUENCIES IN ONE CALL ---
+    void get_cpu_frequencies(double* mhz, int cores) {
+        for (int i = 0; i < cores; i++) {
+            mhz[i] = get_cpu_frequency(i);
+        }
+    }
+
     // --- FUNCTION 18: DISK IO RATES ---
     void get_disk_io_rates(const char* disk, double* read_mbps, double* write_mbps) {
         string path = "/sys/block/" + string(disk) + "/stat";
@@ -438,17 +613,19 @@ extern "C" {
             long long read_bytes = sectors_read * 512;
             long long write_bytes = sectors_written * 512;
             
-            DiskIOStats curr = {read_bytes, write_bytes};
+            DiskIOStats curr = {read_bytes, write_bytes, monotonic_seconds()};
             string disk_name(disk);
             
-            if (prev_disk_stats.find(disk_name) != prev_disk_stats.end()) {
-                DiskIOStats& prev = prev_disk_stats[disk_name];
+            auto it = prev_disk_stats.find(disk_name);
+            if (it != prev_disk_stats.end() && curr.sampled > it->second.sampled) {
+                DiskIOStats& prev = it->second;
                 long long read_delta = curr.read_bytes - prev.read_bytes;
                 long long write_delta = curr.write_bytes - prev.write_bytes;
+                double elapsed = curr.sampled - prev.sampled;
                 
                 // Convert to MB/s
-                *read_mbps = read_delta / (1024.0 * 1024.0);
-                *write_mbps = write_delta / (1024.0 * 1024.0);
+                *read_mbps = read_delta / (1024.0 * 1024.0) / elapsed;
+                *write_mbps = write_delta / (1024.0 * 1024.0) / elapsed;
             } else {
                 *read_mbps = 0.0;
                 *write_mbps = 0.0;
@@ -461,6 +638,15 @@ extern "C" {
         }
     }
 
+    // --- FUNCTION 18b: ALL DISKS IN ONE CALL ---
+    // names is a newline-separated list of count devices, mbps gets read/write pairs
+    void get_disk_io_batch(const char* names, int count, double* mbps) {
+        vector<string> disks = split_names(names, count);
+        for (int i = 0; i < count; i++) {
+            get_disk_io_rates(disks[i].c_str(), &mbps[i * 2], &mbps[i * 2 + 1]);
+        }
+    }
+
     // --- FUNCTION 19: PROCESS COUNTS BY STATE ---
     void get_process_counts(int* running, int* sleeping, int* stopped, int* zombie) {
         *running = 0;
@@ -502,6 +688,194 @@ extern "C" {
         closedir(dir);
     }
 
+    // --- FUNCTION 20b: VMSTAT RATES ---
+    int get_vmstat_field_count() {
+        return VMSTAT_COUNT;
+    }
+
+    const char* get_vmstat_field_name(int index) {
+        if (index < 0 || index >= VMSTAT_COUNT) return nullptr;
+        return VMSTAT_KEYS[index];
+    }
+
+    // Fills totals[VMSTAT_COUNT] with the /proc/vmstat counters and
+    // rates[VMSTAT_COUNT] with their per-second change since the previous
+    // call (0 on the first call). Counters the kernel lacks read as 0.
+    void get_vmstat_rates(double* rates, long long* totals) {
+        char buf[16384];
+        if (read_proc_file("/proc/vmstat", buf, sizeof(buf)) < 0) {
+            for (int i = 0; i < VMSTAT_COUNT; i++) {
+                rates[i] = 0.0;
+                totals[i] = 0;
+            }
+            return;
+        }
+        parse_key_values(buf, ' ', VMSTAT_KEYS, VMSTAT_COUNT, totals);
+
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        double now = ts.tv_sec + ts.tv_nsec / 1e9;
+        double elapsed = now - prev_vmstat_time;
+        bool first = prev_vmstat_time == 0.0;
+
+        for (int i = 0; i < VMSTAT_COUNT; i++) {
+            if (totals[i] < 0) totals[i] = 0;
+            long long delta = totals[i] - prev_vmstat[i];
+            rates[i] = (!first && elapsed > 0 && delta > 0) ? delta / elapsed : 0.0;
+            prev_vmstat[i] = totals[i];
+        }
+        prev_vmstat_time = now;
+    }
+
+    // --- FUNCTION 20c: INTERRUPT / SOFTIRQ COUNTER MATRIX ---
+    // Parses /proc/interrupts (source 0) or /proc/softirqs (source 1) into a
+    // row-major (source x CPU) matrix with max_cpus columns, writing straight
+    // into the caller's buffers:
+    //   counts, rates      [max_rows * max_cpus] counters and per-second deltas
+    //   row_rates          [max_rows] per-source total rate
+    //   row_top_cpu        [max_rows] column of the busiest CPU for that source
+    //   cpu_rates          [max_cpus] per-CPU total rate
+    //   cpu_ids            [max_cpus] CPU number of each column (offline CPUs are not listed)
+    //   names              [max_rows * name_len] "label: description", NUL-terminated
+    // Returns the number of rows in the file and sets *n_cpus to the number of
+    // CPU columns. If either exceeds the buffers, only what fits is written
+    // and the caller should grow them. Rates are 0 on the first call and
+    // whenever the set of rows or CPU columns changed.
+    int get_irq_matrix(int source, int max_rows, int max_cpus, long long* counts, double* rates,
+                       double* row_rates, int* row_top_cpu, double* cpu_rates, int* cpu_ids,
+                       int* n_cpus, char* names, int name_len) {
+        const char* path = source == 0 ? "/proc/interrupts" : "/proc/softirqs";
+        IrqMatrixState& prev = prev_irq[source == 0 ? 0 : 1];
+        *n_cpus = 0;
+
+        // The table grows with CPUs x sources, so read it in chunks
+        int fd = open(path, O_RDONLY);
+        if (fd < 0) return -1;
+        string text;
+        char chunk[65536];
+        ssize_t n;
+        while ((n = read(fd, chunk, sizeof(chunk))) > 0) {
+            text.append(chunk, n);
+        }
+        close(fd);
+
+        const char* p = text.c_str();
+        const char* end = p + text.size();
+
+        // Header: "CPU0 CPU1 ..."
+        const char* line_end = strchr(p, '\n');
+        if (!line_end) return -1;
+        vector<int> header_ids;
+        for (const char* q = p; q < line_end; ) {
+            const char* cpu = strstr(q, "CPU");
+            if (!cpu || cpu >= line_end) break;
+            header_ids.push_back(atoi(cpu + 3));
+            q = cpu + 3;
+        }
+        int cpus = (int)header_ids.size();
+        for (int c = 0; c < cpus && c < max_cpus; c++) cpu_ids[c] = header_ids[c];
+        *n_cpus = cpus;
+        int cols = cpus < max_cpus ? cpus : max_cpus;
+        p = line_end + 1;
+
+        int rows = 0;
+        vector<string> labels;
+        while (p < end) {
+            line_end = strchr(p, '\n');
+            if (!line_end) line_end = end;
+
+            const char* colon = (const char*)memchr(p, ':', line_end - p);
+            if (colon) {
+                const char* label = p;
+                while (label < colon && *label == ' ') label++;
+                labels.emplace_back(label, colon - label);
+
+                if (rows < max_rows) {
+                    long long* row = counts + (size_t)rows * max_cpus;
+                    const char* q = colon + 1;
+                    int c = 0;
+                    for (; c < cpus; c++) {
+                        char* next;
+                        long long value = strtoll(q, &next, 10);
+                        // Rows such as ERR and MIS carry a single total
+                        if (next == q || next > line_end) break;
+                        if (c < cols) row[c] = value;
+                        q = next;
+                    }
+                    for (int k = c; k < cols; k++) row[k] = 0;
+
+                    // The rest of the line describes the source; squeeze runs of spaces
+                    char* name = names + (size_t)rows * name_len;
+                    int len = snprintf(name, name_len, "%s", labels.back().c_str());
+                    while (q < line_end && *q == ' ') q++;
+                    if (q < line_end && len + 2 < name_len) {
+                        name[len++] = ':';
+                        name[len++] = ' ';
+                        bool space = false;
+                        for (; q < line_end && len < name_len - 1; q++) {
+                            if (*q == ' ') {
+                                space = true;
+                                continue;
+                            }
+                            if (space) {
+                                name[len++] = ' ';
+                                space = false;
+                                if (len >= name_len - 1) break;
+                            }
+                            name[len++] = *q;
+                        }
+                        name[len] = '\0';
+                    }
+                }
+                rows++;
+            }
+            p = line_end + 1;
+        }
+
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        double now = ts.tv_sec + ts.tv_nsec / 1e9;
+        int stored_rows = rows < max_rows ? rows : max_rows;
+        size_t cells = (size_t)stored_rows * max_cpus;
+        // Offline CPUs drop out of the header and shift later columns left, so
+        // the columns must be the same CPUs, not just the same count
+        bool comparable = prev.time > 0.0 && prev.stride == max_cpus && prev.cpu_ids == header_ids
+                          && prev.labels == labels && prev.counts.size() == cells && now > prev.time;
+
+        // Deltas over the whole matrix in one pass
+        if (comparable) {
+            double scale = 1.0 / (now - prev.time);
+            const long long* before = prev.counts.data();
+            for (size_t i = 0; i < cells; i++) {
+                long long delta = counts[i] - before[i];
+                rates[i] = delta > 0 ? delta * scale : 0.0;
+            }
+        } else {
+            for (size_t i = 0; i < cells; i++) rates[i] = 0.0;
+        }
+
+        for (int c = 0; c < cols; c++) cpu_rates[c] = 0.0;
+        for (int r = 0; r < stored_rows; r++) {
+            const double* row = rates + (size_t)r * max_cpus;
+            double total = 0.0;
+            int top = 0;
+            for (int c = 0; c < cols; c++) {
+                total += row[c];
+                cpu_rates[c] += row[c];
+                if (row[c] > row[top]) top = c;
+            }
+            row_rates[r] = total;
+            row_top_cpu[r] = top;
+        }
+
+        prev.counts.assign(counts, counts + cells);
+        prev.labels.swap(labels);
+        prev.cpu_ids.swap(header_ids);
+        prev.stride = max_cpus;
+        prev.time = now;
+        return rows;
+    }
+
     // --- FUNCTION 20: NETWORK CONNECTIONS COUNT ---
     int get_network_connections_count() {
         int count = 0;
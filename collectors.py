@@ -0,0 +1,1169 @@
+"""Data collection shared by the PyQt GUI and the terminal UI.
+
+Loads the C++ backend (libbackend.so) and provides the /proc and /sys
+readers and stateful collectors both frontends are built on.
+"""
+import ctypes
+import os
+import re
+import time
+import errno
+import heapq
+import select
+import socket
+import struct
+import threading
+from array import array
+from collections import deque, namedtuple
+
+# --- 1. LOAD C++ LIBRARY ---
+lib_path = os.path.abspath("./libbackend.so")
+c_lib = ctypes.CDLL(lib_path)
+
+c_lib.get_uptime_seconds.restype = ctypes.c_double
+c_lib.get_cpu_usage.restype = ctypes.c_double
+c_lib.get_memory_usage.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
+c_lib.get_process_cpu_usage.argtypes = [ctypes.c_int]
+c_lib.get_process_cpu_usage.restype = ctypes.c_double
+c_lib.get_thread_cpu_usage.argtypes = [ctypes.c_int, ctypes.c_int]
+c_lib.get_thread_cpu_usage.restype = ctypes.c_double
+c_lib.get_process_memory_mb.argtypes = [ctypes.c_int]
+c_lib.get_process_memory_mb.restype = ctypes.c_long
+c_lib.get_load_averages.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
+c_lib.get_swap_usage.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
+c_lib.get_memory_breakdown.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
+c_lib.get_iowait_percentage.restype = ctypes.c_double
+c_lib.get_context_switches.restype = ctypes.c_longlong
+c_lib.get_network_stats.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong), 
+                                     ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong),
+                                     ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong)]
+c_lib.get_network_throughput.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
+c_lib.get_cpu_temperature.restype = ctypes.c_double
+c_lib.get_file_descriptors.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
+c_lib.get_process_fd_count.argtypes = [ctypes.c_int]
+c_lib.get_process_fd_count.restype = ctypes.c_int
+c_lib.get_battery_info.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_double)]
+c_lib.get_cpu_frequency.argtypes = [ctypes.c_int]
+c_lib.get_cpu_frequency.restype = ctypes.c_double
+c_lib.get_cpu_frequencies.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.c_int]
+c_lib.get_network_batch.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_longlong),
+                                    ctypes.POINTER(ctypes.c_double)]
+c_lib.get_disk_io_batch.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_double)]
+c_lib.get_disk_io_rates.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
+c_lib.get_process_counts.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+c_lib.get_network_connections_count.restype = ctypes.c_int
+c_lib.get_meminfo_field_count.restype = ctypes.c_int
+c_lib.get_meminfo_field_name.argtypes = [ctypes.c_int]
+c_lib.get_meminfo_field_name.restype = ctypes.c_char_p
+c_lib.get_meminfo_fields.argtypes = [ctypes.POINTER(ctypes.c_longlong)]
+c_lib.get_vmstat_field_count.restype = ctypes.c_int
+c_lib.get_vmstat_field_name.argtypes = [ctypes.c_int]
+c_lib.get_vmstat_field_name.restype = ctypes.c_char_p
+c_lib.get_vmstat_rates.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_longlong)]
+c_lib.get_irq_matrix.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                 ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_double),
+                                 ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_int),
+                                 ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_int),
+                                 ctypes.POINTER(ctypes.c_int), ctypes.c_char_p, ctypes.c_int]
+c_lib.get_irq_matrix.restype = ctypes.c_int
+
+# Array layouts of get_meminfo_fields / get_vmstat_rates, as reported by the backend
+MEMINFO_FIELDS = tuple(c_lib.get_meminfo_field_name(i).decode() for i in range(c_lib.get_meminfo_field_count()))
+MEMINFO_INDEX = {name: i for i, name in enumerate(MEMINFO_FIELDS)}
+VMSTAT_FIELDS = tuple(c_lib.get_vmstat_field_name(i).decode() for i in range(c_lib.get_vmstat_field_count()))
+VMSTAT_INDEX = {name: i for i, name in enumerate(VMSTAT_FIELDS)}
+
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024
+
+# --- 2. PYTHON HELPER (Process List) ---
+def get_process_list(pids=None):
+    """Reads /proc to get process list, sorted by Memory usage.
+
+    pids can be a known set of live PIDs to skip listing /proc.
+    """
+    processes = []
+    try:
+        for pid in (os.listdir('/proc') if pids is None else map(str, pids)):
+            if pid.isdigit():
+                try:
+                    with open(f'/proc/{pid}/status', 'r') as f:
+                        name = "???"
+                        state = "?"
+                        memory = 0
+
+                        for line in f:
+                            if line.startswith("Name:"):
+                                name = line.split(":")[1].strip()
+                            elif line.startswith("State:"):
+                                state = line.split(":")[1].strip().split()[0]
+                            elif line.startswith("VmRSS:"):
+                                mem_str = line.split(":")[1].strip().split()[0]
+                                memory = int(mem_str) // 1024
+
+                        if memory > 0:
+                            processes.append((int(pid), name, state, memory))
+                except (IOError, FileNotFoundError):
+                    continue
+    except Exception:
+        pass
+
+    processes.sort(key=lambda x: x[3], reverse=True)
+    return processes[:50]
+
+def get_thread_list(pid):
+    """Reads /proc/<pid>/task to get the threads of one process, sorted by TID."""
+    threads = []
+    try:
+        for tid in os.listdir(f'/proc/{pid}/task'):
+            try:
+                with open(f'/proc/{pid}/task/{tid}/stat', 'r') as f:
+                    line = f.read()
+            except (IOError, FileNotFoundError):
+                continue
+
+            # The name may contain spaces and parentheses, so split around the last ')'
+            end = line.rfind(')')
+            name = line[line.find('(') + 1:end]
+            fields = line[end + 2:].split()
+            if not fields:
+                continue
+
+            # fields[0] is the state (field 3), fields[36] the last CPU it ran on (field 39)
+            state = fields[0]
+            last_cpu = int(fields[36]) if len(fields) > 36 else -1
+            threads.append((int(tid), name, state, last_cpu))
+    except Exception:
+        pass
+
+    threads.sort()
+    return threads
+
+def get_process_stats(pids=None):
+    """Reads /proc/<pid>/stat and /proc/<pid>/io for every process.
+
+    pids can be a known set of live PIDs to skip listing /proc.
+    Returns {pid: (ppid, name, state, cpu_ticks, rss_kb, io_bytes, start_time)}.
+    """
+    stats = {}
+    try:
+        if pids is None:
+            pids = [pid for pid in os.listdir('/proc') if pid.isdigit()]
+    except Exception:
+        return stats
+
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                line = f.read()
+        except (IOError, FileNotFoundError):
+            continue
+
+        end = line.rfind(')')
+        name = line[line.find('(') + 1:end]
+        fields = line[end + 2:].split()
+        if len(fields) < 22:
+            continue
+
+        io_bytes = 0
+        try:
+            with open(f'/proc/{pid}/io', 'r') as f:
+                for io_line in f:
+                    if io_line.startswith('read_bytes:') or io_line.startswith('write_bytes:'):
+                        io_bytes += int(io_line.split(':')[1])
+        except (IOError, PermissionError, FileNotFoundError):
+            pass
+
+        # fields[n] is stat field n + 3: state (3), ppid (4), utime/stime (14/15),
+        # starttime (22) and rss in pages (24)
+        stats[int(pid)] = (int(fields[1]), name, fields[0],
+                           int(fields[11]) + int(fields[12]),
+                           int(fields[21]) * PAGE_KB, io_bytes, int(fields[19]))
+    return stats
+
+class ProcessNode:
+    __slots__ = ('pid', 'ppid', 'start_time', 'name', 'state', 'parent', 'children',
+                 'cpu_ticks', 'io_bytes', 'own', 'total')
+
+    def __init__(self, pid, ppid, start_time):
+        self.pid = pid
+        self.ppid = ppid
+        self.start_time = start_time
+        self.name = "???"
+        self.state = "?"
+        self.parent = None
+        self.children = set()
+        self.cpu_ticks = None
+        self.io_bytes = None
+        # [CPU %, RSS kB, I/O bytes/s] for the process itself and for its whole subtree
+        self.own = [0.0, 0, 0.0]
+        self.total = [0.0, 0, 0.0]
+
+class ProcessTree:
+    """Processes grouped by PPID with CPU, RSS and I/O rolled up per subtree.
+
+    update() only touches what changed since the previous sample: forked and
+    exited processes are linked in or out, and a process whose values moved
+    pushes the difference up its ancestor chain. After each update, added,
+    removed, moved and changed list the PIDs the view has to refresh.
+
+    Which processes to link in or out comes from the fork/exit PIDs passed
+    to note_events() after each ProcEventCollector.poll(), so finding them
+    costs in proportion to the churn. Without events every node is checked
+    against the sample instead. Reading the per-process CPU, RSS and I/O
+    values (get_process_stats) is still one pass over every process.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.last_time = None
+        self.added = []
+        self.removed = []
+        self.moved = []
+        self.changed = set()
+        # PIDs forked/exited since the previous update; None until note_events() is used
+        self.pending_spawns = None
+        self.pending_exits = None
+
+    def note_events(self, spawned, exited):
+        """Queues the PIDs a ProcEventCollector.poll() saw fork and exit for the next update()."""
+        if self.pending_spawns is None:
+            self.pending_spawns, self.pending_exits = set(), set()
+        self.pending_spawns |= spawned
+        self.pending_exits |= exited
+
+    def update(self, stats):
+        now = time.monotonic()
+        elapsed = now - self.last_time if self.last_time is not None else 0
+        self.last_time = now
+        self.added = []
+        self.removed = []
+        self.moved = []
+        self.changed = set()
+
+        if self.pending_exits is None:
+            # No events: exited processes, including PIDs reused by a new process
+            exited = [pid for pid, node in self.nodes.items()
+                      if pid not in stats or stats[pid][6] != node.start_time]
+            spawned = stats
+        else:
+            # A PID reused within the interval was reported as an exit and a fork
+            exited = [pid for pid in self.pending_exits if pid in self.nodes]
+            spawned = stats if not self.nodes else self.pending_spawns
+            self.pending_spawns, self.pending_exits = set(), set()
+        for pid in exited:
+            self.remove(pid)
+
+        # Forked processes get a node first so parents exist before linking
+        for pid in spawned:
+            sample = stats.get(pid)
+            if sample is not None and pid not in self.nodes:
+                self.nodes[pid] = ProcessNode(pid, sample[0], sample[6])
+                self.added.append(pid)
+        new_pids = set(self.added)
+        self.changed.update(new_pids)
+
+        for pid, (ppid, name, state, cpu_ticks, rss_kb, io_bytes, start_time) in stats.items():
+            node = self.nodes.get(pid)
+            if node is None or node.start_time != start_time:
+                # Fork or exit events were lost (socket overflow, polling
+                # fallback); the node is linked to its parent once both exist
+                if node is not None:
+                    self.remove(pid)
+                node = self.nodes[pid] = ProcessNode(pid, ppid, start_time)
+                self.added.append(pid)
+                new_pids.add(pid)
+                self.changed.add(pid)
+
+            # (Re)link when the parent changed, or a parent we were waiting for appeared
+            if node.ppid != ppid or (node.parent is None and ppid in self.nodes):
+                was_linked = node.parent is not None
+                self.detach(node)
+                node.ppid = ppid
+                self.attach(node)
+                if pid not in new_pids and (was_linked or node.parent is not None):
+                    self.moved.append(pid)
+
+            if node.name != name or node.state != state:
+                node.name = name
+                node.state = state
+                self.changed.add(pid)
+
+            cpu = 0.0
+            io_rate = 0.0
+            if elapsed > 0 and node.cpu_ticks is not None:
+                cpu = max(cpu_ticks - node.cpu_ticks, 0) / CLK_TCK / elapsed * 100.0
+                io_rate = max(io_bytes - node.io_bytes, 0) / elapsed
+            node.cpu_ticks = cpu_ticks
+            node.io_bytes = io_bytes
+
+            delta = [cpu - node.own[0], rss_kb - node.own[1], io_rate - node.own[2]]
+            if delta[0] or delta[1] or delta[2]:
+                node.own = [cpu, rss_kb, io_rate]
+                self.add_to_total(node, delta)
+
+    def remove(self, pid):
+        node = self.nodes.pop(pid)
+        self.detach(node)
+        # Children stay in the tree as roots until their new PPID is seen
+        for child_pid in node.children:
+            self.nodes[child_pid].parent = None
+        self.removed.append(pid)
+
+    def detach(self, node):
+        parent = node.parent
+        if parent is None:
+            return
+        self.add_to_ancestors(node, [-v for v in node.total])
+        parent.children.discard(node.pid)
+        node.parent = None
+
+    def attach(self, node):
+        parent = self.nodes.get(node.ppid)
+        if parent is None:
+            return
+
+        # Never link a node below itself
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor is node:
+                return
+            ancestor = ancestor.parent
+
+        node.parent = parent
+        parent.children.add(node.pid)
+        self.add_to_ancestors(node, node.total)
+
+    def add_to_total(self, node, delta):
+        total = node.total
+        total[0] += delta[0]
+        total[1] += delta[1]
+        total[2] += delta[2]
+        self.changed.add(node.pid)
+        self.add_to_ancestors(node, delta)
+
+    def add_to_ancestors(self, node, delta):
+        ancestor = node.parent
+        while ancestor is not None:
+            total = ancestor.total
+            total[0] += delta[0]
+            total[1] += delta[1]
+            total[2] += delta[2]
+            self.changed.add(ancestor.pid)
+            ancestor = ancestor.parent
+
+def list_pids():
+    """Returns the set of PIDs currently in /proc."""
+    try:
+        return {int(pid) for pid in os.listdir('/proc') if pid.isdigit()}
+    except Exception:
+        return set()
+
+def thread_count(pid):
+    """Threads in a thread group, 0 if it is gone.
+
+    The link count of /proc/<pid>/task is 2 plus the number of threads, so
+    this is one stat() instead of listing the directory.
+    """
+    try:
+        return os.stat(f'/proc/{pid}/task').st_nlink - 2
+    except OSError:
+        return 0
+
+def read_comm(pid):
+    try:
+        with open(f'/proc/{pid}/comm', 'r') as f:
+            return f.read().strip()
+    except (IOError, FileNotFoundError):
+        return "???"
+
+# Netlink proc connector (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+NLMSG_DONE = 3
+NLMSG_HDR = struct.Struct('=IHHII')      # len, type, flags, seq, pid
+CN_MSG_HDR = struct.Struct('=IIIIHH')    # idx, val, seq, ack, len, flags
+PROC_EVENT_HDR = struct.Struct('=IIQ')   # what, cpu, timestamp_ns
+PROC_EVENT_IDS = struct.Struct('=IIII')  # fork: parent pid/tgid, child pid/tgid; exit: pid, tgid, code, signal
+
+class ProcEventCollector:
+    """Tracks process spawns and exits from fork/exec/exit events.
+
+    Events come from the netlink proc connector, read on a background thread
+    so bursts are drained as they happen. The connector needs CAP_NET_ADMIN;
+    without it the collector falls back to diffing /proc listings each poll,
+    which can't see processes that live less than one interval. The live
+    set is resynced from /proc every resync_secs, and right away if the
+    socket overflowed during a fork storm, so it can't drift from /proc.
+    """
+
+    def __init__(self, short_lived_secs=1.0, log_size=50, resync_secs=5.0):
+        self.short_lived_secs = short_lived_secs
+        self.resync_secs = resync_secs
+        self.lock = threading.Lock()
+        self.births = {}                           # pid -> [spawn time, name] for processes seen forking
+        self.deferred_exits = {}                   # tgid -> [other threads left, last exit code] after its leader exited
+        self.pending_spawns = set()                # processes forked/exited since the last poll
+        self.pending_exits = set()
+        self.spawned_pids = set()                  # ... as of the last poll, for ProcessTree.note_events
+        self.exited_pids = set()
+        self.short_lived = deque(maxlen=log_size)  # (pid, name, lifetime secs, exit code)
+        self.spawned = 0
+        self.exited = 0
+        self.needs_resync = False
+        self.spawn_rate = 0.0
+        self.exit_rate = 0.0
+        self.last_time = time.monotonic()
+
+        # Subscribe before listing /proc: anything that exits in between is
+        # still queued on the socket and gets removed once the reader starts
+        self.sock = self.open_socket()
+        self.live_pids = list_pids()
+        self.last_resync = time.monotonic()
+        if self.sock is not None:
+            threading.Thread(target=self.read_events, daemon=True).start()
+
+    @property
+    def event_driven(self):
+        return self.sock is not None
+
+    def open_socket(self):
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            sock.bind((0, CN_IDX_PROC))
+            op = struct.pack('=I', PROC_CN_MCAST_LISTEN)
+            cn_msg = CN_MSG_HDR.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0) + op
+            sock.send(NLMSG_HDR.pack(NLMSG_HDR.size + len(cn_msg), NLMSG_DONE, 0, 0, os.getpid()) + cn_msg)
+            return sock
+        except (OSError, AttributeError):
+            return None
+
+    def read_events(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except OSError as e:
+                if e.errno == errno.ENOBUFS:
+                    # Events were dropped; the next poll rebuilds the live set
+                    with self.lock:
+                        self.needs_resync = True
+                    continue
+                with self.lock:
+                    self.sock = None
+                return
+
+            offset = 0
+            while offset + NLMSG_HDR.size <= len(data):
+                msg_len = NLMSG_HDR.unpack_from(data, offset)[0]
+                if msg_len < NLMSG_HDR.size:
+                    break
+                self.handle_event(data, offset + NLMSG_HDR.size + CN_MSG_HDR.size)
+                offset += (msg_len + 3) & ~3
+
+    def handle_event(self, data, offset):
+        if offset + PROC_EVENT_HDR.size + PROC_EVENT_IDS.size > len(data):
+            return
+        what = PROC_EVENT_HDR.unpack_from(data, offset)[0]
+        a, b, c, d = PROC_EVENT_IDS.unpack_from(data, offset + PROC_EVENT_HDR.size)
+
+        if what == PROC_EVENT_FORK:
+            # New threads also fork; only a new thread group is a new process
+            if c != d:
+                if d in self.deferred_exits:
+                    with self.lock:
+                        if d in self.deferred_exits:
+                            self.deferred_exits[d][0] += 1
+                return
+            name = read_comm(d)
+            with self.lock:
+                self.live_pids.add(d)
+                self.pending_spawns.add(d)
+                self.births[d] = [time.monotonic(), name]
+                self.spawned += 1
+        elif what == PROC_EVENT_EXEC:
+            name = read_comm(b)
+            with self.lock:
+                if b in self.births:
+                    self.births[b][1] = name
+        elif what == PROC_EVENT_EXIT:
+            if a == b:
+                # A group leader can exit before its other threads; the
+                # process lives on until the last of them exits
+                threads = thread_count(a)
+                if threads > 1:
+                    with self.lock:
+                        self.deferred_exits[a] = [threads - 1, c]
+                    return
+            elif b not in self.deferred_exits:
+                return
+            with self.lock:
+                if a != b:
+                    deferred = self.deferred_exits.get(b)
+                    if deferred is None:
+                        return
+                    deferred[0] -= 1
+                    deferred[1] = c
+                    if deferred[0] > 0:
+                        return
+                    del self.deferred_exits[b]
+                self.record_exit(b, c)
+
+    def record_exit(self, pid, code):
+        """Counts an exit and logs it if short-lived; called with the lock held."""
+        self.live_pids.discard(pid)
+        self.pending_exits.add(pid)
+        self.exited += 1
+        birth = self.births.pop(pid, None)
+        if birth is not None:
+            lifetime = time.monotonic() - birth[0]
+            if lifetime < self.short_lived_secs:
+                self.short_lived.append((pid, birth[1], lifetime, code >> 8))
+
+    def poll(self):
+        """Updates spawn/exit rates since the previous poll and returns the live PID set."""
+        now = time.monotonic()
+        elapsed = now - self.last_time
+        self.last_time = now
+
+        if self.sock is None:
+            current = list_pids()
+            with self.lock:
+                self.spawned_pids = current - self.live_pids
+                self.exited_pids = self.live_pids - current
+                spawned, exited = len(self.spawned_pids), len(self.exited_pids)
+                self.live_pids = current
+        else:
+            resync = None
+            if self.needs_resync or now - self.last_resync >= self.resync_secs:
+                resync = list_pids()
+                self.last_resync = now
+            with self.lock:
+                # Threads that exited while the leader's exit was being handled
+                # can be counted twice; a group down to its zombie leader is done
+                for tgid in [tgid for tgid in self.deferred_exits if thread_count(tgid) <= 1]:
+                    self.record_exit(tgid, self.deferred_exits.pop(tgid)[1])
+                spawned, exited = self.spawned, self.exited
+                self.spawned = self.exited = 0
+                if resync is not None:
+                    # Whatever the events missed shows up as a difference to /proc
+                    self.pending_spawns |= resync - self.live_pids
+                    self.pending_exits |= self.live_pids - resync
+                    self.live_pids = resync
+                    self.deferred_exits = {tgid: deferred for tgid, deferred in self.deferred_exits.items()
+                                           if tgid in resync}
+                    self.needs_resync = False
+                # Processes older than the threshold can no longer count as short-lived
+                cutoff = now - self.short_lived_secs
+                self.births = {pid: birth for pid, birth in self.births.items()
+                               if birth[0] >= cutoff and (resync is None or pid in resync)}
+                self.spawned_pids, self.exited_pids = self.pending_spawns, self.pending_exits
+                self.pending_spawns, self.pending_exits = set(), set()
+
+        if elapsed > 0:
+            self.spawn_rate = spawned / elapsed
+            self.exit_rate = exited / elapsed
+
+        with self.lock:
+            return set(self.live_pids)
+
+    def recent_short_lived(self, count=5):
+        with self.lock:
+            return list(self.short_lived)[-count:]
+
+def get_process_disk_io(pid):
+    """Get disk I/O information for a process."""
+    try:
+        with open(f'/proc/{pid}/io', 'r') as f:
+            read_bytes = 0
+            write_bytes = 0
+            for line in f:
+                if line.startswith('read_bytes:'):
+                    read_bytes = int(line.split(':')[1].strip())
+                elif line.startswith('write_bytes:'):
+                    write_bytes = int(line.split(':')[1].strip())
+
+            total_mb = (read_bytes + write_bytes) / (1024 * 1024)
+            if total_mb > 1024:
+                return f"{total_mb/1024:.1f} GB"
+            elif total_mb > 1:
+                return f"{total_mb:.1f} MB"
+            else:
+                return f"{total_mb*1024:.0f} KB"
+    except (IOError, PermissionError, FileNotFoundError):
+        return "N/A"
+
+def format_io_rate(bytes_per_sec):
+    """Formats a byte rate as KB/s or MB/s."""
+    mb = bytes_per_sec / (1024 * 1024)
+    if mb > 1:
+        return f"{mb:.1f} MB/s"
+    return f"{bytes_per_sec / 1024:.0f} KB/s"
+
+def get_per_core_cpu_usage():
+    """Returns list of CPU usage percentages for each core."""
+    core_usages = []
+    try:
+        with open('/proc/stat', 'r') as f:
+            for line in f:
+                if line.startswith('cpu') and not line.startswith('cpu '):
+                    parts = line.split()
+                    if len(parts) >= 5:
+                        user = int(parts[1])
+                        nice = int(parts[2])
+                        system = int(parts[3])
+                        idle = int(parts[4])
+                        iowait = int(parts[5]) if len(parts) > 5 else 0
+                        
+                        total = user + nice + system + idle + iowait
+                        active = user + nice + system
+                        
+                        if total > 0:
+                            usage = (active / total) * 100
+                            core_usages.append(usage)
+    except Exception:
+        pass
+    return core_usages
+
+# hwmon sensor kinds: file prefix -> (scale of the raw sysfs value, unit)
+HWMON_KINDS = {
+    'temp': (1000.0, '°C'),
+    'fan': (1.0, 'RPM'),
+    'in': (1000.0, 'V'),
+    'curr': (1000.0, 'A'),
+    'power': (1000000.0, 'W'),
+}
+HWMON_INPUT_RE = re.compile(r'^(temp|fan|in|curr|power)(\d+)_(input|average)$')
+# hwmon drivers that report CPU package/core temperatures
+CPU_HWMON_CHIPS = {'coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'cpu-thermal'}
+
+class HwmonSensor:
+    __slots__ = ('chip', 'kind', 'label', 'fd', 'max', 'crit', 'value')
+
+    def __init__(self, chip, kind, label, fd, max_value, crit_value):
+        self.chip = chip
+        self.kind = kind
+        self.label = label
+        self.fd = fd
+        self.max = max_value
+        self.crit = crit_value
+        self.value = None
+
+    @property
+    def unit(self):
+        return HWMON_KINDS[self.kind][1]
+
+    def is_package(self):
+        return self.label.startswith('Package') or self.label in ('Tctl', 'Tdie')
+
+def read_sysfs_value(path):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except (IOError, FileNotFoundError):
+        return None
+
+class HwmonCollector:
+    """Temperatures, fans, voltages, currents and power from every hwmon chip.
+
+    Chips and their *_input files are discovered once and kept open, so a
+    tick is one pread() per sensor. Labels and the *_max/*_crit thresholds
+    are read at discovery. Discovery runs again only when the set of
+    /sys/class/hwmon entries changes or an open sensor stops reading
+    (hotplug or driver reload).
+    """
+
+    def __init__(self, root='/sys/class/hwmon'):
+        self.root = root
+        self.entries = None
+        self.sensors = []
+        self.discover()
+
+    def list_entries(self):
+        try:
+            return sorted(os.listdir(self.root))
+        except OSError:
+            return []
+
+    def close(self):
+        for sensor in self.sensors:
+            os.close(sensor.fd)
+        self.sensors = []
+
+    def discover(self):
+        self.close()
+        self.entries = self.list_entries()
+        for entry in self.entries:
+            chip_dir = os.path.join(self.root, entry)
+            chip = read_sysfs_value(os.path.join(chip_dir, 'name')) or entry
+            try:
+                files = sorted(os.listdir(chip_dir))
+            except OSError:
+                continue
+
+            seen = set()
+            for filename in files:
+                match = HWMON_INPUT_RE.match(filename)
+                if not match:
+                    continue
+                kind, index = match.group(1), match.group(2)
+                prefix = f"{kind}{index}"
+                # power sensors may expose both power1_input and power1_average
+                if prefix in seen:
+                    continue
+                seen.add(prefix)
+
+                try:
+                    fd = os.open(os.path.join(chip_dir, filename), os.O_RDONLY)
+                except OSError:
+                    continue
+
+                scale = HWMON_KINDS[kind][0]
+                label = read_sysfs_value(os.path.join(chip_dir, f"{prefix}_label")) or prefix
+                thresholds = []
+                for suffix in ('max', 'crit'):
+                    raw = read_sysfs_value(os.path.join(chip_dir, f"{prefix}_{suffix}"))
+                    try:
+                        thresholds.append(int(raw) / scale if raw is not None else None)
+                    except ValueError:
+                        thresholds.append(None)
+                self.sensors.append(HwmonSensor(chip, kind, label, fd, *thresholds))
+
+    def collect(self):
+        """Reads every sensor and returns the list of HwmonSensor objects."""
+        if self.list_entries() != self.entries:
+            self.discover()
+
+        for attempt in range(2):
+            failed = False
+            for sensor in self.sensors:
+                try:
+                    sensor.value = int(os.pread(sensor.fd, 32, 0)) / HWMON_KINDS[sensor.kind][0]
+                except ValueError:
+                    sensor.value = None
+                except OSError as e:
+                    # Some sensors return EAGAIN/ENODATA while idle; anything else means the device went away
+                    if e.errno in (errno.EAGAIN, errno.ENODATA, errno.EIO):
+                        sensor.value = None
+                    else:
+                        failed = True
+                        break
+            if not failed:
+                break
+            self.discover()
+        return self.sensors
+
+    def cpu_temperatures(self):
+        return [s for s in self.sensors if s.kind == 'temp' and s.chip in CPU_HWMON_CHIPS]
+
+    def package_temperature(self):
+        """The CPU package temperature, or the hottest CPU sensor if no package sensor exists."""
+        temps = [s for s in self.cpu_temperatures() if s.value is not None]
+        for sensor in temps:
+            if sensor.is_package():
+                return sensor
+        return max(temps, key=lambda s: s.value, default=None)
+
+IRQ_SOURCE_INTERRUPTS = 0
+IRQ_SOURCE_SOFTIRQS = 1
+IRQ_NAME_LEN = 96
+
+class IrqCollector:
+    """Per-CPU counters from /proc/interrupts or /proc/softirqs.
+
+    The backend parses the table into a (source x CPU) matrix held in
+    buffers allocated here once, and computes the per-second deltas and the
+    per-source and per-CPU totals in a single pass over it. Python only
+    looks at the per-row and per-CPU totals, never at individual cells.
+    The buffers grow if the table outgrows them (CPU or device hotplug).
+    """
+
+    def __init__(self, source=IRQ_SOURCE_INTERRUPTS, rows=256):
+        self.source = source
+        self.rows = 0
+        self.cpus = 0
+        self.names = []
+        self.names_raw = b""
+        self.allocate(rows, os.cpu_count() or 1)
+
+    def allocate(self, max_rows, max_cpus):
+        self.max_rows = max_rows
+        self.max_cpus = max_cpus
+        self.counts = (ctypes.c_longlong * (max_rows * max_cpus))()
+        self.rates = (ctypes.c_double * (max_rows * max_cpus))()
+        self.row_rates = (ctypes.c_double * max_rows)()
+        self.row_top_cpu = (ctypes.c_int * max_rows)()
+        self.cpu_rates = (ctypes.c_double * max_cpus)()
+        self.cpu_ids = (ctypes.c_int * max_cpus)()
+        self.n_cpus = ctypes.c_int()
+        self.name_buf = ctypes.create_string_buffer(max_rows * IRQ_NAME_LEN)
+        # Built once per allocation so read() creates no ctypes objects
+        self.args = (self.source, max_rows, max_cpus, self.counts, self.rates, self.row_rates,
+                     self.row_top_cpu, self.cpu_rates, self.cpu_ids, ctypes.pointer(self.n_cpus),
+                     self.name_buf, IRQ_NAME_LEN)
+
+    def read(self):
+        return c_lib.get_irq_matrix(*self.args)
+
+    def collect(self):
+        rows = self.read()
+        if rows > self.max_rows or self.n_cpus.value > self.max_cpus:
+            self.allocate(max(rows, self.max_rows), max(self.n_cpus.value, self.max_cpus))
+            rows = self.read()
+        self.rows = max(rows, 0)
+        self.cpus = self.n_cpus.value
+
+        # Names only change when sources are added or removed
+        raw = self.name_buf.raw[:self.rows * IRQ_NAME_LEN]
+        if raw != self.names_raw:
+            self.names_raw = raw
+            self.names = [raw[i:i + IRQ_NAME_LEN].split(b"\0", 1)[0].decode(errors='replace')
+                          for i in range(0, len(raw), IRQ_NAME_LEN)]
+
+    def top_sources(self, count=8):
+        """Busiest sources as [(name, rate/s, busiest CPU, that CPU's rate/s)]."""
+        top = heapq.nlargest(count, range(self.rows), key=self.row_rates.__getitem__)
+        result = []
+        for row in top:
+            if self.row_rates[row] <= 0:
+                break
+            col = self.row_top_cpu[row]
+            result.append((self.names[row], self.row_rates[row], self.cpu_ids[col],
+                           self.rates[row * self.max_cpus + col]))
+        return result
+
+    def cpu_totals(self):
+        """[(cpu, rate/s)] for every CPU column."""
+        return [(self.cpu_ids[c], self.cpu_rates[c]) for c in range(min(self.cpus, self.max_cpus))]
+
+def irq_hot_spots(collectors, count=8):
+    """CPUs handling the most interrupts plus softirqs, as [(cpu, rate/s)]."""
+    totals = {}
+    for collector in collectors:
+        for cpu, rate in collector.cpu_totals():
+            totals[cpu] = totals.get(cpu, 0.0) + rate
+    return heapq.nlargest(count, totals.items(), key=lambda item: item[1])
+
+def group_sensors(sensors):
+    """Groups sensors by chip as [(chip, [sensors])], CPU chips first."""
+    groups = {}
+    for sensor in sensors:
+        groups.setdefault(sensor.chip, []).append(sensor)
+    return sorted(groups.items(), key=lambda item: item[0] not in CPU_HWMON_CHIPS)
+
+def format_sensor(sensor):
+    """Formats a reading with its label and thresholds, e.g. 'Core 0: 71.0°C (max 80.0, crit 100.0)'."""
+    return f"{sensor.label}: {format_sensor_value(sensor)}"
+
+def format_sensor_value(sensor):
+    """Formats a reading with its thresholds but no label, e.g. '71.0°C (max 80.0, crit 100.0)'."""
+    if sensor.value is None:
+        return "N/A"
+    precision = 0 if sensor.kind == 'fan' else (2 if sensor.kind in ('in', 'curr', 'power') else 1)
+    text = f"{sensor.value:.{precision}f}{'' if sensor.unit == '°C' else ' '}{sensor.unit}"
+    limits = [f"{name} {value:.{precision}f}" for name, value in (('max', sensor.max), ('crit', sensor.crit))
+              if value is not None]
+    if limits:
+        text += f" ({', '.join(limits)})"
+    # Fans report a minimum, not a maximum, so only flag the other kinds
+    if sensor.kind != 'fan':
+        if sensor.crit is not None and sensor.value >= sensor.crit:
+            text += " [CRIT]"
+        elif sensor.max is not None and sensor.value >= sensor.max:
+            text += " [MAX]"
+    return text
+
+# Filesystems without meaningful space usage (or, for squashfs, always full)
+PSEUDO_FS_TYPES = {
+    'proc', 'sysfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2', 'mqueue', 'debugfs',
+    'tracefs', 'securityfs', 'pstore', 'bpf', 'configfs', 'fusectl', 'hugetlbfs',
+    'autofs', 'binfmt_misc', 'rpc_pipefs', 'nsfs', 'efivarfs', 'selinuxfs', 'ramfs',
+    'squashfs',
+}
+# Filesystems whose statvfs can block for as long as the server is unreachable
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ceph', 'glusterfs', '9p', 'afs', 'lustre'}
+
+MountUsage = namedtuple('MountUsage', [
+    'mount_point', 'fs_type', 'source', 'total_bytes', 'used_bytes', 'avail_bytes', 'percent',
+    'inodes_total', 'inodes_used', 'inode_percent', 'responsive',
+])
+
+def parse_mountinfo(text):
+    """Returns [(mount_point, fs_type, source)] for real filesystems, one per mount point."""
+    mounts = {}
+    for line in text.splitlines():
+        left, sep, right = line.partition(' - ')
+        if not sep:
+            continue
+        fields = left.split()
+        fs_info = right.split()
+        if len(fields) < 5 or len(fs_info) < 2:
+            continue
+        fs_type = fs_info[0]
+        if fs_type in PSEUDO_FS_TYPES:
+            continue
+        # Spaces and other special characters are octal-escaped (\040)
+        mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[4])
+        # A later mount on the same point hides the earlier one
+        mounts.pop(mount_point, None)
+        mounts[mount_point] = (mount_point, fs_type, fs_info[1])
+    return list(mounts.values())
+
+class StatvfsCall:
+    """os.statvfs on its own daemon thread.
+
+    A call stuck on a dead server keeps only its own thread, which neither
+    delays other mounts nor holds up interpreter exit.
+    """
+
+    def __init__(self, path):
+        self.finished = threading.Event()
+        self.result = None
+        self.failed = False
+        threading.Thread(target=self.run, args=(path,), name="statvfs", daemon=True).start()
+
+    def run(self, path):
+        try:
+            self.result = os.statvfs(path)
+        except OSError:
+            self.failed = True
+        self.finished.set()
+
+class MountCollector:
+    """Space and inode usage for every real mount.
+
+    /proc/self/mountinfo is only re-parsed after the kernel flags it with
+    POLLPRI, i.e. when something was mounted or unmounted. statvfs on
+    network and FUSE filesystems runs on daemon threads with a timeout; a
+    mount whose previous call is still stuck is reported unresponsive and
+    not queried again until that call returns. At most max_outstanding
+    calls run at once; past that, new remote mounts are reported
+    unresponsive instead of spawning more threads.
+    """
+
+    def __init__(self, timeout=0.2, max_outstanding=16):
+        self.timeout = timeout
+        self.max_outstanding = max_outstanding
+        self.pending = {}
+        self.mounts = []
+        self.mountinfo = open('/proc/self/mountinfo', 'r')
+        self.poller = select.poll()
+        self.poller.register(self.mountinfo, select.POLLPRI | select.POLLERR)
+        self.read_mounts()
+
+    def read_mounts(self):
+        self.mountinfo.seek(0)
+        self.mounts = parse_mountinfo(self.mountinfo.read())
+
+    @staticmethod
+    def may_block(fs_type):
+        return fs_type in NETWORK_FS_TYPES or fs_type.startswith('fuse')
+
+    def collect(self):
+        if self.poller.poll(0):
+            self.read_mounts()
+
+        # Forget calls for mounts that have gone away, and count the ones still running
+        mounted = {mount_point for mount_point, _, _ in self.mounts}
+        for mount_point in [m for m in self.pending if m not in mounted]:
+            del self.pending[mount_point]
+        outstanding = sum(1 for call in self.pending.values() if not call.finished.is_set())
+
+        results = {}
+        remote = {}
+        for mount_point, fs_type, source in self.mounts:
+            if not self.may_block(fs_type):
+                try:
+                    results[mount_point] = os.statvfs(mount_point)
+                except OSError:
+                    results[mount_point] = None
+                continue
+
+            call = self.pending.get(mount_point)
+            if call is not None and not call.finished.is_set():
+                # Still stuck from an earlier tick; don't wait on it again
+                results[mount_point] = False
+            elif outstanding >= self.max_outstanding:
+                results[mount_point] = False
+            else:
+                call = self.pending[mount_point] = StatvfsCall(mount_point)
+                remote[mount_point] = call
+                outstanding += 1
+
+        if remote:
+            deadline = time.monotonic() + self.timeout
+            for mount_point, call in remote.items():
+                if not call.finished.wait(max(0.0, deadline - time.monotonic())):
+                    results[mount_point] = False
+                    continue
+                results[mount_point] = None if call.failed else call.result
+                del self.pending[mount_point]
+
+        usages = []
+        for mount_point, fs_type, source in self.mounts:
+            st = results.get(mount_point)
+            if st is False:
+                usages.append(MountUsage(mount_point, fs_type, source, 0, 0, 0, 0.0, 0, 0, 0.0, False))
+                continue
+            if st is None or st.f_blocks == 0:
+                continue
+            # Same arithmetic as df: reserved blocks count as neither used nor available
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            avail = st.f_bavail * st.f_frsize
+            percent = used / (used + avail) * 100 if used + avail > 0 else 0.0
+            inodes_used = st.f_files - st.f_ffree
+            inode_percent = inodes_used / st.f_files * 100 if st.f_files > 0 else 0.0
+            usages.append(MountUsage(mount_point, fs_type, source, st.f_blocks * st.f_frsize, used, avail,
+                                     percent, st.f_files, inodes_used, inode_percent, True))
+        return usages
+
+def get_network_interfaces():
+    """Get list of network interfaces."""
+    interfaces = []
+    try:
+        for iface in os.listdir('/sys/class/net'):
+            if iface != 'lo':  # Skip loopback
+                interfaces.append(iface)
+    except:
+        pass
+    return interfaces
+
+def get_disk_devices():
+    """Get list of disk devices."""
+    devices = []
+    try:
+        for device in os.listdir('/sys/block'):
+            if not device.startswith('loop') and not device.startswith('ram'):
+                devices.append(device)
+    except:
+        pass
+    return devices
+
+# BatchReader.device_metrics names each rate "<interface or disk><suffix>"
+NETWORK_METRIC_SUFFIXES = ('.rx_mbps', '.tx_mbps')
+DISK_METRIC_SUFFIXES = ('.read_mbps', '.write_mbps')
+DEVICE_METRIC_SUFFIXES = NETWORK_METRIC_SUFFIXES + DISK_METRIC_SUFFIXES
+
+def element_pointers(buf, ctype):
+    """A ctypes pointer to each element of an array.array, for out-parameters."""
+    size = ctypes.sizeof(ctype)
+    return tuple(ctypes.pointer(ctype.from_buffer(buf, i * size)) for i in range(len(buf)))
+
+class BatchReader:
+    """Typed buffers allocated once and filled in place by the backend.
+
+    The buffers are array.array objects shared with ctypes through the buffer
+    protocol, and the argument tuples pointing into them are built here, so
+    each read_* method is a single FFI call that creates no ctypes objects.
+    Per-interface, per-disk and per-core values come from batch entry points
+    rather than one call per item. Returned arrays are overwritten by the
+    next read.
+    """
+
+    def __init__(self, interfaces=(), devices=(), cores=None):
+        self.interfaces = list(interfaces)
+        self.devices = list(devices)
+        self.cores = cores or os.cpu_count() or 1
+        self.interface_names = "\n".join(self.interfaces).encode('utf-8')
+        self.device_names = "\n".join(self.devices).encode('utf-8')
+
+        self.loads = array('d', [0.0] * 3)
+        self.load_args = element_pointers(self.loads, ctypes.c_double)
+        self.file_descriptors = array('l', [0] * 2)
+        self.fd_args = element_pointers(self.file_descriptors, ctypes.c_long)
+        self.process_counts = array('i', [0] * 4)
+        self.process_count_args = element_pointers(self.process_counts, ctypes.c_int)
+        self.battery_state = array('i', [0] * 2)
+        self.battery_rate = array('d', [0.0])
+        self.battery_args = (element_pointers(self.battery_state, ctypes.c_int)
+                             + element_pointers(self.battery_rate, ctypes.c_double))
+
+        # Flat, row-major: six counters / two rates per interface, two rates per disk
+        self.frequencies = array('d', [0.0] * self.cores)
+        self.frequency_view = (ctypes.c_double * self.cores).from_buffer(self.frequencies)
+        self.net_counters = array('q', [0] * (6 * len(self.interfaces)))
+        self.net_counter_view = (ctypes.c_longlong * len(self.net_counters)).from_buffer(self.net_counters)
+        self.net_rates = array('d', [0.0] * (2 * len(self.interfaces)))
+        self.net_rate_view = (ctypes.c_double * len(self.net_rates)).from_buffer(self.net_rates)
+        self.disk_rates = array('d', [0.0] * (2 * len(self.devices)))
+        self.disk_rate_view = (ctypes.c_double * len(self.disk_rates)).from_buffer(self.disk_rates)
+
+    def read_loads(self):
+        """[load1, load5, load15]"""
+        c_lib.get_load_averages(*self.load_args)
+        return self.loads
+
+    def read_file_descriptors(self):
+        """[allocated, max]"""
+        c_lib.get_file_descriptors(*self.fd_args)
+        return self.file_descriptors
+
+    def read_process_counts(self):
+        """[running, sleeping, stopped, zombie]"""
+        c_lib.get_process_counts(*self.process_count_args)
+        return self.process_counts
+
+    def read_battery(self):
+        """(percentage, is_charging, charge_rate); percentage is negative without a battery."""
+        c_lib.get_battery_info(*self.battery_args)
+        return self.battery_state[0], self.battery_state[1], self.battery_rate[0]
+
+    def read_frequencies(self):
+        """MHz per core, -1 where cpufreq is unavailable."""
+        c_lib.get_cpu_frequencies(self.frequency_view, self.cores)
+        return self.frequencies
+
+    def read_network(self):
+        """(counters, rates): rx/tx bytes, packets, errors and rx/tx Mbps per interface."""
+        c_lib.get_network_batch(self.interface_names, len(self.interfaces), self.net_counter_view, self.net_rate_view)
+        return self.net_counters, self.net_rates
+
+    def read_disk_io(self):
+        """Read/write MB/s pairs per disk."""
+        c_lib.get_disk_io_batch(self.device_names, len(self.devices), self.disk_rate_view)
+        return self.disk_rates
+
+    def device_metrics(self):
+        """The last read NIC and disk rates as {"eth0.rx_mbps": ..., "sda.read_mbps": ...}."""
+        metrics = {}
+        for i, iface in enumerate(self.interfaces):
+            for j, suffix in enumerate(NETWORK_METRIC_SUFFIXES):
+                metrics[iface + suffix] = self.net_rates[i * 2 + j]
+        for i, device in enumerate(self.devices):
+            for j, suffix in enumerate(DISK_METRIC_SUFFIXES):
+                metrics[device + suffix] = self.disk_rates[i * 2 + j]
+        return metrics
+
+# --- PER-TICK METRICS ---
+# Names of the values sampled each tick, shared by the alert rules and the
+# exporter (whose system table has these columns, in this order)
+SYSTEM_METRICS = ('cpu', 'iowait', 'load1', 'load5', 'load15', 'mem', 'swap', 'swap_in_rate',
+                  'swap_out_rate', 'major_fault_rate', 'oom_kill_rate', 'fd', 'temp')
+
+def system_metrics(cpu, iowait, temp, loads, meminfo, vmstat_rates, file_descriptors):
+    """One tick's system-wide readings as {name: value}, named as in SYSTEM_METRICS."""
+    mem_total = meminfo[MEMINFO_INDEX['MemTotal']]
+    swap_total = meminfo[MEMINFO_INDEX['SwapTotal']]
+    allocated, max_fd = file_descriptors
+    metrics = {
+        'cpu': cpu,
+        'iowait': iowait,
+        'load1': loads[0],
+        'load5': loads[1],
+        'load15': loads[2],
+        'mem': (mem_total - meminfo[MEMINFO_INDEX['MemAvailable']]) / mem_total * 100 if mem_total > 0 else 0.0,
+        'swap': (swap_total - meminfo[MEMINFO_INDEX['SwapFree']]) / swap_total * 100 if swap_total > 0 else 0.0,
+        'swap_in_rate': vmstat_rates[VMSTAT_INDEX['pswpin']] * PAGE_KB,
+        'swap_out_rate': vmstat_rates[VMSTAT_INDEX['pswpout']] * PAGE_KB,
+        'major_fault_rate': vmstat_rates[VMSTAT_INDEX['pgmajfault']],
+        'oom_kill_rate': vmstat_rates[VMSTAT_INDEX['oom_kill']],
+        'fd': allocated / max_fd * 100 if max_fd > 0 else 0.0,
+    }
+    if temp > 0:
+        metrics['temp'] = temp
+    return metrics
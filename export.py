@@ -0,0 +1,222 @@
+"""Batched export of samples to CSV or Parquet files.
+
+Samples are appended to typed column buffers (array.array, plain lists for
+text) and handed over in batches to a writer thread, so collection never
+waits on disk. Two tables are written into the export directory:
+
+    system.csv / system.parquet        one row per sample, one column per metric
+    processes.csv / processes.parquet  long format: one row per process per sample
+                                       (time, pid, name, state, cpu_percent, rss_kb, io_rate)
+
+CSV files are appended to, unless their header differs, in which case a
+new timestamped file is started. Parquet needs pyarrow and is written one row
+group per batch; an existing Parquet file is replaced.
+"""
+import csv
+import os
+import queue
+import sys
+import threading
+import time
+from array import array
+from collectors import CLK_TCK, SYSTEM_METRICS
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+EXPORT_FORMATS = ('csv', 'parquet')
+
+PROCESS_COLUMNS = (('time', 'd'), ('pid', 'q'), ('name', None), ('state', None),
+                   ('cpu_percent', 'd'), ('rss_kb', 'q'), ('io_rate', 'd'))
+
+class ColumnTable:
+    """Column buffers for one table; typecode None marks a text column."""
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.reset()
+
+    def reset(self):
+        self.data = [array(code) if code else [] for _, code in self.columns]
+
+    def __len__(self):
+        return len(self.data[0])
+
+    def take(self):
+        """Hands the filled buffers over and starts empty ones."""
+        data = self.data
+        self.reset()
+        return data
+
+class TableWriter:
+    """Writes batches of one table; runs only on the writer thread."""
+
+    def __init__(self, path, fmt, columns):
+        self.path = path
+        self.fmt = fmt
+        self.columns = columns
+        self.file = None
+        self.writer = None
+
+    def write(self, data):
+        if self.fmt == 'csv':
+            self.write_csv(data)
+        else:
+            self.write_parquet(data)
+
+    def write_csv(self, data):
+        if self.file is None:
+            header = [name for name, _ in self.columns]
+            new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            if not new:
+                with open(self.path, newline='') as f:
+                    existing = next(csv.reader(f), None)
+                if existing != header:
+                    # Different columns (e.g. another set of NICs); don't mix them into one file
+                    root, ext = os.path.splitext(self.path)
+                    self.path = f"{root}-{time.strftime('%Y%m%d-%H%M%S')}{ext}"
+                    new = True
+            self.file = open(self.path, 'a', newline='')
+            self.writer = csv.writer(self.file)
+            if new:
+                self.writer.writerow(header)
+        self.writer.writerows(zip(*data))
+        self.file.flush()
+
+    def write_parquet(self, data):
+        arrays = []
+        for (name, code), column in zip(self.columns, data):
+            if code is None:
+                arrays.append(pyarrow.array(column, type=pyarrow.string()))
+            else:
+                # Numeric buffers are wrapped without copying
+                kind = pyarrow.float64() if code == 'd' else pyarrow.int64()
+                arrays.append(pyarrow.Array.from_buffers(kind, len(column), [None, pyarrow.py_buffer(column)]))
+        batch = pyarrow.Table.from_arrays(arrays, names=[name for name, _ in self.columns])
+        if self.writer is None:
+            self.writer = pyarrow.parquet.ParquetWriter(self.path, batch.schema)
+        self.writer.write_table(batch)
+
+    def close(self):
+        if self.fmt == 'csv':
+            if self.file is not None:
+                self.file.close()
+        elif self.writer is not None:
+            self.writer.close()
+
+class SampleExporter:
+    """Buffers system and per-process samples and writes them on a background thread.
+
+    The system table has a column for each of SYSTEM_METRICS followed by
+    device_columns (e.g. BatchReader.device_metrics() names); metrics missing
+    from a sample, such as temp without a sensor reading, are written as NaN.
+    A batch is flushed once flush_rows process rows have piled up or
+    flush_interval seconds have passed. If the writer falls behind, samples
+    keep accumulating in memory instead of blocking the caller.
+    """
+
+    def __init__(self, directory, fmt='csv', flush_rows=100000, flush_interval=10.0, device_columns=()):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"unknown export format: {fmt}")
+        if fmt == 'parquet' and pyarrow is None:
+            raise ValueError("Parquet export needs pyarrow (pip install pyarrow)")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fmt = fmt
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+
+        system_columns = [('time', 'd')] + [(name, 'd') for name in SYSTEM_METRICS + tuple(device_columns)]
+        self.system = ColumnTable(system_columns)
+        self.system_writer = TableWriter(self.table_path('system'), fmt, system_columns)
+        self.processes = ColumnTable(PROCESS_COLUMNS)
+        self.process_writer = TableWriter(self.table_path('processes'), fmt, PROCESS_COLUMNS)
+        self.prev_procs = {}  # (pid, start time) -> (cpu_ticks, io_bytes)
+        self.prev_time = None
+        self.last_flush = time.monotonic()
+
+        self.batches = queue.Queue(maxsize=16)
+        self.thread = threading.Thread(target=self.write_loop, name="sample-exporter", daemon=True)
+        self.thread.start()
+
+    def table_path(self, name):
+        return os.path.join(self.directory, f"{name}.{self.fmt}")
+
+    def add(self, metrics, process_stats=None, timestamp=None):
+        """Appends one sample.
+
+        metrics is {name: value} (see collectors.system_metrics); process_stats is
+        get_process_stats output. CPU and I/O rates are computed against the
+        previous add().
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        now = time.monotonic()
+
+        data = self.system.data
+        data[0].append(timestamp)
+        for (name, _), column in zip(self.system.columns[1:], data[1:]):
+            column.append(float(metrics.get(name, float('nan'))))
+
+        if process_stats is not None:
+            self.add_processes(timestamp, now, process_stats)
+        self.prev_time = now
+
+        if len(self.processes) >= self.flush_rows or now - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def add_processes(self, timestamp, now, stats):
+        dt = now - self.prev_time if self.prev_time is not None else 0
+        cpu_scale = 100.0 / CLK_TCK / dt if dt > 0 else 0.0
+        io_scale = 1.0 / dt if dt > 0 else 0.0
+        prev = self.prev_procs
+        current = {}
+        times, pids, names, states, cpus, rss, io = self.processes.data
+        for pid, (ppid, name, state, cpu_ticks, rss_kb, io_bytes, start_time) in stats.items():
+            # Keyed with the start time so a reused PID is never diffed against its predecessor
+            key = (pid, start_time)
+            last = prev.get(key)
+            times.append(timestamp)
+            pids.append(pid)
+            names.append(name)
+            states.append(state)
+            cpus.append((cpu_ticks - last[0]) * cpu_scale if last else 0.0)
+            rss.append(rss_kb)
+            io.append((io_bytes - last[1]) * io_scale if last else 0.0)
+            current[key] = (cpu_ticks, io_bytes)
+        # Replacing the map also forgets exited processes
+        self.prev_procs = current
+
+    def flush(self, wait=False):
+        self.last_flush = time.monotonic()
+        batches = []
+        if len(self.system):
+            batches.append((self.system_writer, self.system))
+        if len(self.processes):
+            batches.append((self.process_writer, self.processes))
+        for writer, table in batches:
+            if self.batches.full() and not wait:
+                # Writer is behind; keep buffering and try again next flush
+                return
+            self.batches.put((writer, table.take()))
+
+    def write_loop(self):
+        while True:
+            item = self.batches.get()
+            if item is None:
+                break
+            writer, data = item
+            try:
+                writer.write(data)
+            except (OSError, ValueError) as e:
+                print(f"export: cannot write {writer.path}: {e}", file=sys.stderr)
+        for writer in (self.system_writer, self.process_writer):
+            writer.close()
+
+    def close(self):
+        """Writes whatever is buffered and waits for the writer thread."""
+        self.flush(wait=True)
+        self.batches.put(None)
+        self.thread.join()
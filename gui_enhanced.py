@@ -1,135 +1,23 @@
 import sys
 import ctypes
-import os
+import threading
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout,
-                             QWidget, QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QFrame, QTabWidget, QGridLayout)
-from PyQt6.QtCore import QTimer, Qt, QRectF
+                             QWidget, QTreeWidget, QTreeWidgetItem, QHeaderView, QProgressBar, QFrame, QTabWidget, QGridLayout,
+                             QPushButton, QSizePolicy, QFileDialog, QMessageBox)
+from PyQt6.QtCore import QTimer, Qt, QRectF, QRect
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QPalette
 from collections import deque
-
-# --- 1. LOAD C++ LIBRARY ---
-lib_path = os.path.abspath("./libbackend.so")
-c_lib = ctypes.CDLL(lib_path)
-
-c_lib.get_uptime_seconds.restype = ctypes.c_double
-c_lib.get_cpu_usage.restype = ctypes.c_double
-c_lib.get_memory_usage.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
-c_lib.get_process_cpu_usage.argtypes = [ctypes.c_int]
-c_lib.get_process_cpu_usage.restype = ctypes.c_double
-c_lib.get_process_memory_mb.argtypes = [ctypes.c_int]
-c_lib.get_process_memory_mb.restype = ctypes.c_long
-c_lib.get_load_averages.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
-c_lib.get_swap_usage.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
-c_lib.get_memory_breakdown.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
-c_lib.get_iowait_percentage.restype = ctypes.c_double
-c_lib.get_context_switches.restype = ctypes.c_longlong
-c_lib.get_network_stats.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong), 
-                                     ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong),
-                                     ctypes.POINTER(ctypes.c_longlong), ctypes.POINTER(ctypes.c_longlong)]
-c_lib.get_network_throughput.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
-c_lib.get_cpu_temperature.restype = ctypes.c_double
-c_lib.get_file_descriptors.argtypes = [ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_long)]
-c_lib.get_process_fd_count.argtypes = [ctypes.c_int]
-c_lib.get_process_fd_count.restype = ctypes.c_int
-c_lib.get_battery_info.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_double)]
-c_lib.get_cpu_frequency.argtypes = [ctypes.c_int]
-c_lib.get_cpu_frequency.restype = ctypes.c_double
-c_lib.get_disk_io_rates.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)]
-c_lib.get_process_counts.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
-c_lib.get_network_connections_count.restype = ctypes.c_int
-
-# --- 2. PYTHON HELPER (Process List) ---
-def get_process_list():
-    """Reads /proc to get process list, sorted by Memory usage."""
-    processes = []
-    try:
-        for pid in os.listdir('/proc'):
-            if pid.isdigit():
-                try:
-                    with open(f'/proc/{pid}/status', 'r') as f:
-                        name = "???"
-                        state = "?"
-                        memory = 0
-
-                        for line in f:
-                            if line.startswith("Name:"):
-                                name = line.split(":")[1].strip()
-                            elif line.startswith("State:"):
-                                state = line.split(":")[1].strip().split()[0]
-                            elif line.startswith("VmRSS:"):
-                                mem_str = line.split(":")[1].strip().split()[0]
-                                memory = int(mem_str) // 1024
-
-                        if memory > 0:
-                            processes.append((int(pid), name, state, memory))
-                except (IOError, FileNotFoundError):
-                    continue
-    except Exception:
-        pass
-
-    processes.sort(key=lambda x: x[3], reverse=True)
-    return processes[:50]
-
-def get_per_core_cpu_usage():
-    """Returns list of CPU usage percentages for each core."""
-    core_usages = []
-    try:
-        with open('/proc/stat', 'r') as f:
-            for line in f:
-                if line.startswith('cpu') and not line.startswith('cpu '):
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        user = int(parts[1])
-                        nice = int(parts[2])
-                        system = int(parts[3])
-                        idle = int(parts[4])
-                        iowait = int(parts[5]) if len(parts) > 5 else 0
-                        
-                        total = user + nice + system + idle + iowait
-                        active = user + nice + system
-                        
-                        if total > 0:
-                            usage = (active / total) * 100
-                            core_usages.append(usage)
-    except Exception:
-        pass
-    return core_usages
-
-def get_disk_usage():
-    """Returns disk usage percentage and used/total in GB for root partition."""
-    try:
-        import shutil
-        total, used, free = shutil.disk_usage('/')
-        total_gb = total // (1024**3)
-        used_gb = used // (1024**3)
-        percent = (used / total) * 100
-        return percent, used_gb, total_gb
-    except Exception:
-        return 0, 0, 0
-
-def get_network_interfaces():
-    """Get list of network interfaces."""
-    interfaces = []
-    try:
-        for iface in os.listdir('/sys/class/net'):
-            if iface != 'lo':  # Skip loopback
-                interfaces.append(iface)
-    except:
-        pass
-    return interfaces
-
-def get_disk_devices():
-    """Get list of disk devices."""
-    devices = []
-    try:
-        for device in os.listdir('/sys/block'):
-            if not device.startswith('loop') and not device.startswith('ram'):
-                devices.append(device)
-    except:
-        pass
-    return devices
-
-# --- 3. CUSTOM WIDGET: MEMORY GAUGE ---
+from array import array
+from collectors import (c_lib, MEMINFO_FIELDS, MEMINFO_INDEX, VMSTAT_FIELDS, VMSTAT_INDEX, PAGE_KB,
+                        get_process_list, get_thread_list, get_process_stats, get_process_disk_io,
+                        get_per_core_cpu_usage, get_network_interfaces, get_disk_devices, format_io_rate,
+                        group_sensors, format_sensor,
+                        ProcessTree, ProcEventCollector, MountCollector, HwmonCollector,
+                        IrqCollector, IRQ_SOURCE_SOFTIRQS, irq_hot_spots, BatchReader, system_metrics)
+from alerts import AlertEngine, load_alert_config, process_metrics, format_alert
+from export import SampleExporter
+
+# --- 1. CUSTOM WIDGET: MEMORY GAUGE ---
 class MemoryGauge(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -188,7 +76,168 @@ class MemoryGauge(QWidget):
         rect_used.moveTop(rect.center().y() + 5)
         painter.drawText(rect_used, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter, f"{int(self.used_mb)} / {int(self.total_mb)} MB")
 
-# --- 4. MAIN WINDOW ---
+# --- 2. CUSTOM WIDGET: CORE HEATMAP ---
+def heat_color(value):
+    """Dark at idle, blue at half load, orange at full load."""
+    stops = ((0, (40, 44, 52)), (50, (41, 121, 255)), (100, (255, 109, 0)))
+    for (v0, c0), (v1, c1) in zip(stops, stops[1:]):
+        if value <= v1:
+            t = (value - v0) / (v1 - v0)
+            return QColor(*(int(a + (b - a) * t) for a, b in zip(c0, c1)))
+    return QColor(*stops[-1][1])
+
+class CoreHeatmap(QWidget):
+    """Per-core CPU usage painted as a single grid of colored cells.
+
+    In grid mode each core is one cell. In history mode each core is a row
+    and the columns are its last samples, written as a sweep so only the
+    newest column changes per tick. Either way only changed cells are
+    repainted.
+    """
+
+    HEAT_COLORS = None
+    CELL_W = 44
+    CELL_H = 30
+    GAP = 3
+    LABEL_W = 56
+    HISTORY_LEN = 60
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if CoreHeatmap.HEAT_COLORS is None:
+            CoreHeatmap.HEAT_COLORS = [heat_color(v) for v in range(101)]
+        self.values = array('B')
+        self.history = array('B')
+        self.history_pos = 0
+        self.show_history = False
+        self.columns = 1
+        self.row_h = self.CELL_H
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setFixedHeight(self.CELL_H)
+
+    def set_show_history(self, enabled):
+        self.show_history = enabled
+        self.relayout()
+        self.update()
+
+    def set_data(self, usages):
+        count = len(usages)
+        if count != len(self.values):
+            self.values = array('B', bytes(count))
+            self.history = array('B', bytes(count * self.HISTORY_LEN))
+            self.history_pos = 0
+            self.relayout()
+            self.update()
+
+        values = self.values
+        changed = []
+        for i, usage in enumerate(usages):
+            value = min(max(int(usage), 0), 100)
+            if value != values[i]:
+                values[i] = value
+                changed.append(i)
+
+        col = self.history_pos
+        history = self.history
+        for i in range(count):
+            history[i * self.HISTORY_LEN + col] = values[i]
+        self.history_pos = (col + 1) % self.HISTORY_LEN
+
+        if self.show_history:
+            # The new column and the cursor column after it
+            self.update(self.history_column_rect(col).united(self.history_column_rect(self.history_pos)))
+        else:
+            for i in changed:
+                self.update(self.cell_rect(i))
+
+    def relayout(self):
+        count = len(self.values)
+        if self.show_history:
+            self.row_h = min(max(240 // max(count, 1), 3), 16)
+            self.setFixedHeight(max(count * self.row_h, self.row_h))
+        else:
+            self.columns = max(1, (self.width() + self.GAP) // (self.CELL_W + self.GAP))
+            rows = (count + self.columns - 1) // self.columns
+            self.setFixedHeight(max(rows, 1) * (self.CELL_H + self.GAP))
+
+    def resizeEvent(self, event):
+        self.relayout()
+        super().resizeEvent(event)
+
+    def cell_rect(self, i):
+        row, col = divmod(i, self.columns)
+        return QRect(col * (self.CELL_W + self.GAP), row * (self.CELL_H + self.GAP), self.CELL_W, self.CELL_H)
+
+    def history_col_w(self):
+        return max((self.width() - self.LABEL_W) / self.HISTORY_LEN, 1.0)
+
+    def history_column_rect(self, col):
+        col_w = self.history_col_w()
+        x = self.LABEL_W + int(col * col_w)
+        return QRect(x, 0, int(col_w) + 2, self.height())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(Qt.PenStyle.NoPen)
+        if self.show_history:
+            self.paint_history(painter, event.rect())
+        else:
+            self.paint_grid(painter, event.rect())
+
+    def paint_grid(self, painter, dirty):
+        step_x = self.CELL_W + self.GAP
+        step_y = self.CELL_H + self.GAP
+        first_col, last_col = dirty.left() // step_x, dirty.right() // step_x
+        first_row, last_row = dirty.top() // step_y, dirty.bottom() // step_y
+        show_text = self.CELL_W >= 40
+
+        painter.setFont(QFont("Segoe UI", 8))
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, min(last_col, self.columns - 1) + 1):
+                i = row * self.columns + col
+                if i >= len(self.values):
+                    break
+                rect = self.cell_rect(i)
+                value = self.values[i]
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(self.HEAT_COLORS[value])
+                painter.drawRect(rect)
+                if show_text:
+                    painter.setPen(QColor("#ffffff"))
+                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{i}\n{value}%")
+
+    def paint_history(self, painter, dirty):
+        col_w = self.history_col_w()
+        first_row = max(dirty.top() // self.row_h, 0)
+        last_row = min(dirty.bottom() // self.row_h, len(self.values) - 1)
+        first_col = max(int((dirty.left() - self.LABEL_W) / col_w), 0)
+        last_col = min(int((dirty.right() - self.LABEL_W) / col_w), self.HISTORY_LEN - 1)
+
+        for row in range(first_row, last_row + 1):
+            y = row * self.row_h
+            base = row * self.HISTORY_LEN
+            for col in range(first_col, last_col + 1):
+                x = self.LABEL_W + int(col * col_w)
+                width = self.LABEL_W + int((col + 1) * col_w) - x
+                if col == self.history_pos:
+                    color = QColor("#ffffff")
+                else:
+                    color = self.HEAT_COLORS[self.history[base + col]]
+                painter.fillRect(x, y, width, self.row_h - 1, color)
+
+        # Core labels, thinned out when rows are too short for text
+        if dirty.left() < self.LABEL_W and last_row >= first_row:
+            painter.fillRect(0, first_row * self.row_h, self.LABEL_W, (last_row - first_row + 1) * self.row_h,
+                             QColor("#21252b"))
+            painter.setPen(QColor("#abb2bf"))
+            painter.setFont(QFont("Segoe UI", 8))
+            label_every = max(1, 12 // self.row_h)
+            for row in range(first_row, last_row + 1):
+                if row % label_every == 0:
+                    painter.drawText(QRect(0, row * self.row_h, self.LABEL_W - 4, max(self.row_h, 12)),
+                                     Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, f"Core {row}")
+
+# --- 3. MAIN WINDOW ---
 class ProfessionalMonitor(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -198,7 +247,36 @@ class ProfessionalMonitor(QMainWindow):
 
         # Network history for graphs
         self.network_history = {}
+        # Processes whose thread rows are shown; only these get /proc/<pid>/task scanned
+        self.expanded_pids = set()
+        # Tree mode state: the incrementally maintained tree and its items by PID
+        self.tree_mode = False
+        self.process_tree = None
+        self.tree_items = {}
+        # Process lifecycle events; also provides the live PID set each tick
+        self.proc_events = ProcEventCollector()
+        self.live_pids = None
+        self.mount_collector = MountCollector()
+        self.mount_usages = []
+        self.hwmon = HwmonCollector()
+        self.sensors = []
+        self.interrupts = IrqCollector()
+        self.softirqs = IrqCollector(IRQ_SOURCE_SOFTIRQS)
+        # Filled in place every tick by one pass over /proc/meminfo and /proc/vmstat
+        self.meminfo = (ctypes.c_longlong * len(MEMINFO_FIELDS))()
+        self.vmstat_rates = (ctypes.c_double * len(VMSTAT_FIELDS))()
+        self.vmstat_totals = (ctypes.c_longlong * len(VMSTAT_FIELDS))()
+        self.prev_oom_kills = None
         self.prev_context_switches = 0
+        # Load, fd, process-count, battery, frequency, NIC and disk buffers, filled in place
+        self.network_interfaces = get_network_interfaces()
+        self.disk_devices = get_disk_devices()
+        self.reader = BatchReader(self.network_interfaces, self.disk_devices)
+        # Rules from ~/.config/linux-monitor/alerts.conf (or the defaults), checked every tick
+        self.alerts = AlertEngine(*load_alert_config())
+        self.process_stats = None
+        self.exporter = None
+        self.exporter_closing = None  # thread finishing a stopped recording
 
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -210,7 +288,30 @@ class ProfessionalMonitor(QMainWindow):
         self.lbl_main_title = QLabel("Linux System Resource Monitor")
         self.lbl_main_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_main_title.setStyleSheet("font-size: 30px; font-weight: bold; color: white; margin-bottom: 5px;")
-        layout.addWidget(self.lbl_main_title)
+
+        # Records every sample to CSV files in a chosen directory
+        self.btn_record = QPushButton("Record Samples")
+        self.btn_record.setCheckable(True)
+        self.btn_record.setStyleSheet("""
+            QPushButton {
+                background-color: #21252b;
+                color: #abb2bf;
+                padding: 8px 16px;
+                border-radius: 5px;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QPushButton:checked {
+                background-color: #FF6D00;
+                color: white;
+            }
+        """)
+        self.btn_record.toggled.connect(self.toggle_recording)
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(self.lbl_main_title, 1)
+        header_layout.addWidget(self.btn_record)
+        layout.addLayout(header_layout)
 
         # --- TAB WIDGET ---
         self.tabs = QTabWidget()
@@ -306,12 +407,16 @@ class ProfessionalMonitor(QMainWindow):
         self.lbl_iowait = QLabel("I/O Wait: N/A")
         self.lbl_iowait.setStyleSheet("font-size: 18px; color: #abb2bf; margin-top: 5px;")
 
+        self.lbl_alerts = QLabel("Alerts: none")
+        self.lbl_alerts.setStyleSheet("font-size: 16px; color: #abb2bf; margin-top: 5px;")
+
         info_layout.addWidget(self.lbl_cpu_title)
         info_layout.addWidget(self.cpu_bar)
         info_layout.addWidget(self.lbl_uptime)
         info_layout.addWidget(self.lbl_temp)
         info_layout.addWidget(self.lbl_load)
         info_layout.addWidget(self.lbl_iowait)
+        info_layout.addWidget(self.lbl_alerts)
         info_layout.addStretch()
 
         dashboard_layout.addWidget(self.mem_gauge)
@@ -324,15 +429,38 @@ class ProfessionalMonitor(QMainWindow):
         system_layout.addWidget(dash_frame)
 
         # --- SECTION B: PER-CORE CPU USAGE ---
+        core_title_layout = QHBoxLayout()
+
         self.lbl_core_title = QLabel("Per-Core CPU Usage")
         self.lbl_core_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #abb2bf; margin-top: 10px;")
-        system_layout.addWidget(self.lbl_core_title)
+        core_title_layout.addWidget(self.lbl_core_title)
+        core_title_layout.addStretch()
+
+        self.btn_core_history = QPushButton("History")
+        self.btn_core_history.setCheckable(True)
+        self.btn_core_history.setStyleSheet("""
+            QPushButton {
+                background-color: #21252b;
+                color: #abb2bf;
+                padding: 6px 14px;
+                border-radius: 5px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:checked {
+                background-color: #2979FF;
+                color: white;
+            }
+        """)
+        core_title_layout.addWidget(self.btn_core_history)
+        system_layout.addLayout(core_title_layout)
+
+        self.core_heatmap = CoreHeatmap()
+        self.btn_core_history.toggled.connect(self.core_heatmap.set_show_history)
 
-        self.core_bars_layout = QVBoxLayout()
-        self.core_bars = []
-        
         cores_frame = QFrame()
-        cores_frame.setLayout(self.core_bars_layout)
+        cores_layout = QVBoxLayout(cores_frame)
+        cores_layout.addWidget(self.core_heatmap)
         cores_frame.setStyleSheet("background-color: #21252b; border-radius: 10px; padding: 10px;")
         system_layout.addWidget(cores_frame)
 
@@ -406,31 +534,55 @@ class ProfessionalMonitor(QMainWindow):
         proc_layout.setContentsMargins(10, 10, 10, 10)
         proc_layout.setSpacing(10)
 
+        title_layout = QHBoxLayout()
+
         self.lbl_proc_title = QLabel("Top Processes (Sorted by Memory)")
         self.lbl_proc_title.setStyleSheet("font-size: 25px; font-weight: bold; color: #abb2bf;")
-        proc_layout.addWidget(self.lbl_proc_title)
+        title_layout.addWidget(self.lbl_proc_title)
+        title_layout.addStretch()
+
+        self.btn_tree_mode = QPushButton("Tree View")
+        self.btn_tree_mode.setCheckable(True)
+        self.btn_tree_mode.setStyleSheet("""
+            QPushButton {
+                background-color: #21252b;
+                color: #abb2bf;
+                padding: 8px 16px;
+                border-radius: 5px;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QPushButton:checked {
+                background-color: #2979FF;
+                color: white;
+            }
+        """)
+        self.btn_tree_mode.toggled.connect(self.toggle_tree_mode)
+        title_layout.addWidget(self.btn_tree_mode)
 
-        self.table = QTableWidget()
+        proc_layout.addLayout(title_layout)
+
+        self.table = QTreeWidget()
         font = QFont()
         font.setPointSize(16)
         self.table.setFont(font)
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(["PID", "Name", "State", "Memory (MB)", "CPU %", "Disk I/O", "FDs"])
+        self.table.setColumnCount(8)
+        self.table.setHeaderLabels(["PID", "Name", "State", "Memory (MB)", "CPU %", "Disk I/O", "FDs", "Last CPU"])
         header_font = QFont()
         header_font.setPointSize(18)
         header_font.setBold(True)
-        self.table.horizontalHeader().setFont(header_font)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setShowGrid(True)
+        self.table.header().setFont(header_font)
+        self.table.setRootIsDecorated(True)
         self.table.setAlternatingRowColors(True)
+        self.table.itemExpanded.connect(self.on_process_expanded)
+        self.table.itemCollapsed.connect(self.on_process_collapsed)
 
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTreeWidget {
                 background-color: #282c34;
                 alternate-background-color: #2c313a;
                 color: #abb2bf;
                 border: none;
-                gridline-color: #3e4451;
             }
             QHeaderView::section {
                 background-color: #21252b;
@@ -439,16 +591,17 @@ class ProfessionalMonitor(QMainWindow):
                 border: none;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTreeWidget::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTreeWidget::item:selected {
                 background-color: #3d4554;
                 color: white;
             }
         """)
 
-        header = self.table.horizontalHeader()
+        header = self.table.header()
+        header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
@@ -456,6 +609,7 @@ class ProfessionalMonitor(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)
 
         proc_layout.addWidget(self.table)
 
@@ -472,7 +626,6 @@ class ProfessionalMonitor(QMainWindow):
         network_layout.addWidget(self.lbl_network_title)
 
         # Network interfaces
-        self.network_interfaces = get_network_interfaces()
         self.network_labels = {}
 
         for iface in self.network_interfaces:
@@ -539,6 +692,22 @@ class ProfessionalMonitor(QMainWindow):
         self.lbl_shared.setStyleSheet("font-size: 16px; color: #abb2bf;")
         mem_layout.addWidget(self.lbl_shared)
 
+        self.lbl_mem_available = QLabel("Available: N/A")
+        self.lbl_mem_available.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        mem_layout.addWidget(self.lbl_mem_available)
+
+        self.lbl_paging = QLabel("Page Faults: N/A")
+        self.lbl_paging.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        mem_layout.addWidget(self.lbl_paging)
+
+        self.lbl_swap_rates = QLabel("Swap In: N/A")
+        self.lbl_swap_rates.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        mem_layout.addWidget(self.lbl_swap_rates)
+
+        self.lbl_oom_kills = QLabel("OOM Kills: N/A")
+        self.lbl_oom_kills.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        mem_layout.addWidget(self.lbl_oom_kills)
+
         info_layout.addWidget(mem_frame)
 
         # CPU Frequency
@@ -577,6 +746,15 @@ class ProfessionalMonitor(QMainWindow):
         self.lbl_process_counts.setStyleSheet("font-size: 16px; color: #abb2bf;")
         sys_layout.addWidget(self.lbl_process_counts)
 
+        self.lbl_process_churn = QLabel("Process Churn: N/A")
+        self.lbl_process_churn.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        sys_layout.addWidget(self.lbl_process_churn)
+
+        self.lbl_short_lived = QLabel("Short-lived Processes: N/A")
+        self.lbl_short_lived.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        self.lbl_short_lived.setWordWrap(True)
+        sys_layout.addWidget(self.lbl_short_lived)
+
         info_layout.addWidget(sys_frame)
 
         # Disk I/O
@@ -588,7 +766,6 @@ class ProfessionalMonitor(QMainWindow):
         disk_io_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2979FF;")
         disk_io_layout.addWidget(disk_io_title)
 
-        self.disk_devices = get_disk_devices()
         self.lbl_disk_io = {}
 
         for device in self.disk_devices:
@@ -599,6 +776,51 @@ class ProfessionalMonitor(QMainWindow):
 
         info_layout.addWidget(disk_io_frame)
 
+        # Filesystems
+        fs_frame = QFrame()
+        fs_layout = QVBoxLayout(fs_frame)
+        fs_frame.setStyleSheet("background-color: #21252b; border-radius: 10px; padding: 15px; margin-bottom: 10px;")
+
+        fs_title = QLabel("Filesystems")
+        fs_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2979FF;")
+        fs_layout.addWidget(fs_title)
+
+        self.lbl_filesystems = QLabel("Loading...")
+        self.lbl_filesystems.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        fs_layout.addWidget(self.lbl_filesystems)
+
+        info_layout.addWidget(fs_frame)
+
+        # Interrupts
+        irq_frame = QFrame()
+        irq_layout = QVBoxLayout(irq_frame)
+        irq_frame.setStyleSheet("background-color: #21252b; border-radius: 10px; padding: 15px; margin-bottom: 10px;")
+
+        irq_title = QLabel("Interrupts")
+        irq_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2979FF;")
+        irq_layout.addWidget(irq_title)
+
+        self.lbl_interrupts = QLabel("Loading...")
+        self.lbl_interrupts.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        irq_layout.addWidget(self.lbl_interrupts)
+
+        info_layout.addWidget(irq_frame)
+
+        # Hardware Sensors
+        sensors_frame = QFrame()
+        sensors_layout = QVBoxLayout(sensors_frame)
+        sensors_frame.setStyleSheet("background-color: #21252b; border-radius: 10px; padding: 15px; margin-bottom: 10px;")
+
+        sensors_title = QLabel("Hardware Sensors")
+        sensors_title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2979FF;")
+        sensors_layout.addWidget(sensors_title)
+
+        self.lbl_sensors = QLabel("Loading...")
+        self.lbl_sensors.setStyleSheet("font-size: 16px; color: #abb2bf;")
+        sensors_layout.addWidget(self.lbl_sensors)
+
+        info_layout.addWidget(sensors_frame)
+
         # Battery (if available)
         battery_frame = QFrame()
         battery_layout = QVBoxLayout(battery_frame)
@@ -625,6 +847,12 @@ class ProfessionalMonitor(QMainWindow):
         self.setPalette(palette)
 
     def update_system_stats(self):
+        # Process lifecycle (drains fork/exit events, or diffs /proc without the connector)
+        self.live_pids = self.proc_events.poll()
+        if self.process_tree is not None:
+            # Queued even on ticks where the tree view skips its update
+            self.process_tree.note_events(self.proc_events.spawned_pids, self.proc_events.exited_pids)
+
         # Uptime
         sec = c_lib.get_uptime_seconds()
         m, s = divmod(sec, 60)
@@ -639,39 +867,42 @@ class ProfessionalMonitor(QMainWindow):
         else:
              self.cpu_bar.setStyleSheet(self.cpu_bar.styleSheet().replace("#FF6D00", "#2979FF"))
 
-        # CPU Temperature
-        temp = c_lib.get_cpu_temperature()
+        # CPU Temperature (hwmon package sensor, falling back to the first thermal zone)
+        self.sensors = self.hwmon.collect()
+        package = self.hwmon.package_temperature()
+        temp = package.value if package is not None else c_lib.get_cpu_temperature()
         if temp > 0:
-            temp_color = "#FF6D00" if temp > 70 else "#2979FF"
+            limit = package.max if package is not None and package.max is not None else 70
+            temp_color = "#FF6D00" if temp > limit else "#2979FF"
             self.lbl_temp.setText(f"CPU Temp: {temp:.1f}°C")
             self.lbl_temp.setStyleSheet(f"font-size: 18px; color: {temp_color}; margin-top: 5px;")
         else:
             self.lbl_temp.setText("CPU Temp: N/A")
 
         # Load Averages
-        load1 = ctypes.c_double()
-        load5 = ctypes.c_double()
-        load15 = ctypes.c_double()
-        c_lib.get_load_averages(ctypes.byref(load1), ctypes.byref(load5), ctypes.byref(load15))
-        self.lbl_load.setText(f"Load Avg: {load1.value:.2f}, {load5.value:.2f}, {load15.value:.2f}")
+        load1, load5, load15 = self.reader.read_loads()
+        self.lbl_load.setText(f"Load Avg: {load1:.2f}, {load5:.2f}, {load15:.2f}")
 
         # I/O Wait
         iowait = c_lib.get_iowait_percentage()
         self.lbl_iowait.setText(f"I/O Wait: {iowait:.2f}%")
 
-        # Memory Gauge
-        total = ctypes.c_long()
-        free = ctypes.c_long()
-        c_lib.get_memory_usage(ctypes.byref(total), ctypes.byref(free))
-        total_mb = total.value // 1024
-        used_mb = total_mb - (free.value // 1024)
+        # Memory Gauge (used = MemTotal - MemAvailable, so reclaimable page cache isn't "used")
+        meminfo = self.meminfo
+        c_lib.get_meminfo_fields(meminfo)
+        total_mb = meminfo[MEMINFO_INDEX['MemTotal']] // 1024
+        used_mb = total_mb - meminfo[MEMINFO_INDEX['MemAvailable']] // 1024
         self.mem_gauge.set_data(used_mb, total_mb)
 
         # Per-Core CPU Usage
         self.update_per_core_cpu()
 
-        # Disk Usage
-        disk_percent, disk_used, disk_total = get_disk_usage()
+        # Disk Usage (all mounts; the bar shows the root filesystem)
+        self.mount_usages = self.mount_collector.collect()
+        root = next((m for m in self.mount_usages if m.mount_point == '/'), None)
+        disk_percent = root.percent if root is not None else 0
+        disk_used = root.used_bytes // (1024**3) if root is not None else 0
+        disk_total = root.total_bytes // (1024**3) if root is not None else 0
         self.disk_bar.setValue(int(disk_percent))
         self.disk_bar.setFormat(f"{disk_percent:.1f}% ({disk_used} GB / {disk_total} GB)")
         if disk_percent > 75:
@@ -680,13 +911,12 @@ class ProfessionalMonitor(QMainWindow):
             self.disk_bar.setStyleSheet(self.disk_bar.styleSheet().replace("#FF6D00", "#2979FF"))
 
         # Swap Usage
-        swap_total = ctypes.c_long()
-        swap_free = ctypes.c_long()
-        c_lib.get_swap_usage(ctypes.byref(swap_total), ctypes.byref(swap_free))
-        if swap_total.value > 0:
-            swap_used_mb = (swap_total.value - swap_free.value) // 1024
-            swap_total_mb = swap_total.value // 1024
-            swap_percent = ((swap_total.value - swap_free.value) / swap_total.value) * 100
+        swap_total = meminfo[MEMINFO_INDEX['SwapTotal']]
+        swap_free = meminfo[MEMINFO_INDEX['SwapFree']]
+        if swap_total > 0:
+            swap_used_mb = (swap_total - swap_free) // 1024
+            swap_total_mb = swap_total // 1024
+            swap_percent = ((swap_total - swap_free) / swap_total) * 100
             self.swap_bar.setValue(int(swap_percent))
             self.swap_bar.setFormat(f"{swap_percent:.1f}% ({swap_used_mb} MB / {swap_total_mb} MB)")
             if swap_percent > 75:
@@ -706,140 +936,243 @@ class ProfessionalMonitor(QMainWindow):
         # System Info
         self.update_system_info()
 
+        # Alerts (after System Info, which refreshes the vmstat rates and fd counts)
+        self.update_alerts(cpu, iowait, temp)
+
     def update_per_core_cpu(self):
-        core_usages = get_per_core_cpu_usage()
-        
-        # Create bars if they don't exist
-        while len(self.core_bars) < len(core_usages):
-            core_num = len(self.core_bars)
-            
-            core_container = QWidget()
-            core_layout = QHBoxLayout(core_container)
-            core_layout.setContentsMargins(0, 0, 0, 0)
-            
-            core_label = QLabel(f"Core {core_num}:")
-            core_label.setStyleSheet("font-size: 14px; color: #abb2bf; min-width: 70px;")
-            
-            core_bar = QProgressBar()
-            core_bar.setTextVisible(True)
-            core_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 2px solid #444;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                    text-align: center;
-                    background-color: #282c34;
-                    color: white;
-                    height: 20px;
-                }
-                QProgressBar::chunk {
-                    background-color: #2979FF;
-                    border-radius: 3px;
-                }
-            """)
-            
-            core_layout.addWidget(core_label)
-            core_layout.addWidget(core_bar)
-            
-            self.core_bars_layout.addWidget(core_container)
-            self.core_bars.append((core_bar, core_container))
-        
-        # Update bar values
-        for i, usage in enumerate(core_usages):
-            if i < len(self.core_bars):
-                bar, _ = self.core_bars[i]
-                bar.setValue(int(usage))
-                if usage > 75:
-                    bar.setStyleSheet(bar.styleSheet().replace("#2979FF", "#FF6D00"))
-                else:
-                    bar.setStyleSheet(bar.styleSheet().replace("#FF6D00", "#2979FF"))
+        self.core_heatmap.set_data(get_per_core_cpu_usage())
 
     def update_process_table(self):
         if self.table.verticalScrollBar().isSliderDown():
             return
 
-        processes = get_process_list()
-        self.table.setRowCount(len(processes))
-
-        for row, (pid, name, state, mem) in enumerate(processes):
-            self.table.setItem(row, 0, QTableWidgetItem(str(pid)))
-            self.table.setItem(row, 1, QTableWidgetItem(name))
+        if self.tree_mode:
+            self.update_process_tree()
+            return
 
-            item_state = QTableWidgetItem(state)
-            item_state.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 2, item_state)
+        processes = get_process_list(self.live_pids)
+
+        # Rows are reused in place so the scroll position survives a refresh.
+        # Signals are blocked so re-expanding rows doesn't re-enter on_process_expanded.
+        self.table.blockSignals(True)
+        while self.table.topLevelItemCount() > len(processes):
+            self.table.takeTopLevelItem(self.table.topLevelItemCount() - 1)
+        while self.table.topLevelItemCount() < len(processes):
+            item = QTreeWidgetItem()
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+            item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
+            for col in (3, 4, 5, 6):
+                item.setTextAlignment(col, Qt.AlignmentFlag.AlignRight)
+            self.table.addTopLevelItem(item)
 
-            item_mem = QTableWidgetItem(f"{mem} MB")
-            item_mem.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.table.setItem(row, 3, item_mem)
+        for row, (pid, name, state, mem) in enumerate(processes):
+            item = self.table.topLevelItem(row)
+            item.setText(0, str(pid))
+            item.setText(1, name)
+            item.setText(2, state)
+            item.setText(3, f"{mem} MB")
 
             # Per-process CPU usage
             cpu_usage = c_lib.get_process_cpu_usage(pid)
-            item_cpu = QTableWidgetItem(f"{cpu_usage:.1f}%")
-            item_cpu.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.table.setItem(row, 4, item_cpu)
+            item.setText(4, f"{cpu_usage:.1f}%")
 
             # Disk I/O (read from /proc/[pid]/io if available)
-            disk_io = self.get_process_disk_io(pid)
-            item_io = QTableWidgetItem(disk_io)
-            item_io.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.table.setItem(row, 5, item_io)
+            item.setText(5, get_process_disk_io(pid))
 
             # File descriptors
             fd_count = c_lib.get_process_fd_count(pid)
-            item_fd = QTableWidgetItem(str(fd_count))
-            item_fd.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.table.setItem(row, 6, item_fd)
-
-    def get_process_disk_io(self, pid):
-        """Get disk I/O information for a process."""
-        try:
-            with open(f'/proc/{pid}/io', 'r') as f:
-                read_bytes = 0
-                write_bytes = 0
-                for line in f:
-                    if line.startswith('read_bytes:'):
-                        read_bytes = int(line.split(':')[1].strip())
-                    elif line.startswith('write_bytes:'):
-                        write_bytes = int(line.split(':')[1].strip())
-                
-                total_mb = (read_bytes + write_bytes) / (1024 * 1024)
-                if total_mb > 1024:
-                    return f"{total_mb/1024:.1f} GB"
-                elif total_mb > 1:
-                    return f"{total_mb:.1f} MB"
-                else:
-                    return f"{total_mb*1024:.0f} KB"
-        except (IOError, PermissionError, FileNotFoundError):
-            return "N/A"
+            item.setText(6, str(fd_count))
+
+            # Threads are only enumerated for processes the user expanded
+            if pid in self.expanded_pids:
+                self.update_thread_rows(item, pid)
+                item.setExpanded(True)
+            else:
+                item.takeChildren()
+                item.setExpanded(False)
+
+        # Forget expansions for processes that exited or left the list
+        self.expanded_pids.intersection_update(pid for pid, _, _, _ in processes)
+        self.table.blockSignals(False)
+
+    def toggle_tree_mode(self, checked):
+        self.tree_mode = checked
+        self.table.blockSignals(True)
+        self.table.clear()
+        self.table.blockSignals(False)
+        self.expanded_pids.clear()
+        self.tree_items = {}
+        self.process_tree = ProcessTree() if checked else None
+
+        if checked:
+            self.lbl_proc_title.setText("Process Tree (Subtree Totals)")
+            self.table.setHeaderLabels(["PID", "Name", "State", "Memory (MB)", "CPU %", "Disk I/O/s", "", ""])
+        else:
+            self.lbl_proc_title.setText("Top Processes (Sorted by Memory)")
+            self.table.setHeaderLabels(["PID", "Name", "State", "Memory (MB)", "CPU %", "Disk I/O", "FDs", "Last CPU"])
+        self.update_process_table()
+
+    def update_process_tree(self):
+        tree = self.process_tree
+        # Kept for this tick's per-process alert rules
+        self.process_stats = get_process_stats(self.live_pids)
+        tree.update(self.process_stats)
+
+        # Only forks, exits, reparents and changed values touch the widget
+        for pid in tree.removed:
+            item = self.tree_items.pop(pid, None)
+            if item is None:
+                continue
+            for child in item.takeChildren():
+                self.table.addTopLevelItem(child)
+            self.take_tree_item(item)
+
+        for pid in tree.added:
+            item = QTreeWidgetItem()
+            item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
+            for col in (3, 4, 5):
+                item.setTextAlignment(col, Qt.AlignmentFlag.AlignRight)
+            self.tree_items[pid] = item
+
+        for pid in tree.added + tree.moved:
+            item = self.tree_items[pid]
+            node = tree.nodes[pid]
+            self.take_tree_item(item)
+            if node.parent is not None:
+                self.tree_items[node.parent.pid].addChild(item)
+            else:
+                self.table.addTopLevelItem(item)
+
+        for pid in tree.changed:
+            node = tree.nodes.get(pid)
+            if node is None:
+                continue
+            cpu, rss_kb, io_rate = node.total
+            item = self.tree_items[pid]
+            item.setText(0, str(pid))
+            item.setText(1, node.name)
+            item.setText(2, node.state)
+            item.setText(3, f"{rss_kb // 1024} MB")
+            item.setText(4, f"{cpu:.1f}%")
+            item.setText(5, format_io_rate(io_rate))
+
+    def take_tree_item(self, item):
+        parent = item.parent()
+        if parent is not None:
+            parent.removeChild(item)
+        elif item.treeWidget() is not None:
+            self.table.takeTopLevelItem(self.table.indexOfTopLevelItem(item))
+
+    def update_thread_rows(self, item, pid):
+        threads = get_thread_list(pid)
+
+        while item.childCount() > len(threads):
+            item.removeChild(item.child(item.childCount() - 1))
+        while item.childCount() < len(threads):
+            child = QTreeWidgetItem()
+            child.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
+            child.setTextAlignment(4, Qt.AlignmentFlag.AlignRight)
+            child.setTextAlignment(7, Qt.AlignmentFlag.AlignRight)
+            item.addChild(child)
+
+        for row, (tid, name, state, last_cpu) in enumerate(threads):
+            child = item.child(row)
+            child.setText(0, str(tid))
+            child.setText(1, name)
+            child.setText(2, state)
+
+            cpu_usage = c_lib.get_thread_cpu_usage(pid, tid)
+            child.setText(4, f"{cpu_usage:.1f}%")
+            child.setText(7, str(last_cpu) if last_cpu >= 0 else "")
+
+    def on_process_expanded(self, item):
+        if self.tree_mode or item.parent() is not None:
+            return
+        pid = int(item.text(0))
+        self.expanded_pids.add(pid)
+        self.update_thread_rows(item, pid)
+
+    def on_process_collapsed(self, item):
+        if self.tree_mode or item.parent() is not None:
+            return
+        self.expanded_pids.discard(int(item.text(0)))
+
+    def toggle_recording(self, checked):
+        if checked:
+            directory = QFileDialog.getExistingDirectory(self, "Record samples to")
+            try:
+                self.exporter = (SampleExporter(directory, device_columns=self.reader.device_metrics())
+                                 if directory else None)
+            except (ValueError, OSError) as e:
+                QMessageBox.warning(self, "Record Samples", f"Cannot record to {directory}: {e}")
+            if self.exporter is None:
+                self.btn_record.blockSignals(True)
+                self.btn_record.setChecked(False)
+                self.btn_record.blockSignals(False)
+                return
+            self.btn_record.setText("Recording...")
+        elif self.exporter is not None:
+            # Writing out the last batches can take a while; do it off the GUI
+            # thread and re-enable the button once it's done (see update_alerts)
+            self.exporter_closing = threading.Thread(target=self.exporter.close, name="exporter-close")
+            self.exporter_closing.start()
+            self.exporter = None
+            self.btn_record.setEnabled(False)
+            self.btn_record.setText("Finishing...")
+
+    def closeEvent(self, event):
+        # Quitting has to wait for everything to be written
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
+        if self.exporter_closing is not None:
+            self.exporter_closing.join()
+        super().closeEvent(event)
+
+    def update_alerts(self, cpu, iowait, temp):
+        metrics = system_metrics(cpu, iowait, temp, self.reader.loads, self.meminfo, self.vmstat_rates,
+                                 self.reader.file_descriptors)
+        metrics.update(self.reader.device_metrics())
+        stats = self.process_stats
+        if stats is None and (self.alerts.needs_processes or self.exporter is not None):
+            stats = get_process_stats(self.live_pids)
+        self.process_stats = None
+        per_process, names = None, None
+        if self.alerts.needs_processes:
+            per_process, names = process_metrics(stats)
+        self.alerts.evaluate(metrics, per_process, names)
+
+        # Recording shares this tick's metrics and process stats with the alerts
+        if self.exporter is not None:
+            self.exporter.add(metrics, stats)
+        elif self.exporter_closing is not None and not self.exporter_closing.is_alive():
+            self.exporter_closing = None
+            self.btn_record.setEnabled(True)
+            self.btn_record.setText("Record Samples")
+
+        active = self.alerts.active()
+        if active:
+            lines = [format_alert(rule, pid, names.get(pid, "") if names else "", value)
+                     for rule, pid, value in active[:5]]
+            if len(active) > 5:
+                lines.append(f"... and {len(active) - 5} more")
+            self.lbl_alerts.setText("Alerts:\n" + "\n".join(lines))
+            self.lbl_alerts.setStyleSheet("font-size: 16px; color: #FF6D00; margin-top: 5px;")
+        else:
+            self.lbl_alerts.setText("Alerts: none")
+            self.lbl_alerts.setStyleSheet("font-size: 16px; color: #abb2bf; margin-top: 5px;")
 
     def update_network_stats(self):
-        # Update throughput for each interface
-        for iface in self.network_interfaces:
-            rx_mbps = ctypes.c_double()
-            tx_mbps = ctypes.c_double()
-            c_lib.get_network_throughput(iface.encode('utf-8'), ctypes.byref(rx_mbps), ctypes.byref(tx_mbps))
-            
+        # Throughput and packet stats for every interface in one backend call
+        counters, rates = self.reader.read_network()
+        for i, iface in enumerate(self.network_interfaces):
             self.network_labels[iface]['throughput'].setText(
-                f"Throughput: ↓ {rx_mbps.value:.2f} Mbps | ↑ {tx_mbps.value:.2f} Mbps"
+                f"Throughput: ↓ {rates[i * 2]:.2f} Mbps | ↑ {rates[i * 2 + 1]:.2f} Mbps"
             )
 
-            # Get packet stats
-            rx_bytes = ctypes.c_longlong()
-            tx_bytes = ctypes.c_longlong()
-            rx_packets = ctypes.c_longlong()
-            tx_packets = ctypes.c_longlong()
-            rx_errors = ctypes.c_longlong()
-            tx_errors = ctypes.c_longlong()
-            
-            c_lib.get_network_stats(iface.encode('utf-8'), 
-                                   ctypes.byref(rx_bytes), ctypes.byref(tx_bytes),
-                                   ctypes.byref(rx_packets), ctypes.byref(tx_packets),
-                                   ctypes.byref(rx_errors), ctypes.byref(tx_errors))
-            
+            rx_packets, tx_packets, rx_errors, tx_errors = counters[i * 6 + 2:i * 6 + 6]
             self.network_labels[iface]['stats'].setText(
-                f"Packets: RX {rx_packets.value} | TX {tx_packets.value} | Errors: RX {rx_errors.value} | TX {tx_errors.value}"
+                f"Packets: RX {rx_packets} | TX {tx_packets} | Errors: RX {rx_errors} | TX {tx_errors}"
             )
 
         # Network connections count
@@ -847,21 +1180,39 @@ class ProfessionalMonitor(QMainWindow):
         self.lbl_connections.setText(f"Active Network Connections: {connections}")
 
     def update_system_info(self):
-        # Memory Breakdown
-        cached = ctypes.c_long()
-        buffers = ctypes.c_long()
-        shared = ctypes.c_long()
-        c_lib.get_memory_breakdown(ctypes.byref(cached), ctypes.byref(buffers), ctypes.byref(shared))
-        
-        self.lbl_cached.setText(f"Cached: {cached.value // 1024} MB")
-        self.lbl_buffers.setText(f"Buffers: {buffers.value // 1024} MB")
-        self.lbl_shared.setText(f"Shared: {shared.value // 1024} MB")
+        # Memory Breakdown (self.meminfo was filled this tick by update_system_stats)
+        meminfo = self.meminfo
+        self.lbl_cached.setText(f"Cached: {meminfo[MEMINFO_INDEX['Cached']] // 1024} MB")
+        self.lbl_buffers.setText(f"Buffers: {meminfo[MEMINFO_INDEX['Buffers']] // 1024} MB")
+        self.lbl_shared.setText(f"Shared: {meminfo[MEMINFO_INDEX['Shmem']] // 1024} MB")
+        self.lbl_mem_available.setText(
+            f"Available: {meminfo[MEMINFO_INDEX['MemAvailable']] // 1024} MB | Free: {meminfo[MEMINFO_INDEX['MemFree']] // 1024} MB"
+            f" | Dirty: {meminfo[MEMINFO_INDEX['Dirty']] // 1024} MB"
+        )
+
+        # Paging (rates from /proc/vmstat deltas)
+        rates = self.vmstat_rates
+        totals = self.vmstat_totals
+        c_lib.get_vmstat_rates(rates, totals)
+        self.lbl_paging.setText(
+            f"Page Faults: {rates[VMSTAT_INDEX['pgfault']]:,.0f}/sec | Major: {rates[VMSTAT_INDEX['pgmajfault']]:,.0f}/sec"
+        )
+        swap_in_kb = rates[VMSTAT_INDEX['pswpin']] * PAGE_KB
+        swap_out_kb = rates[VMSTAT_INDEX['pswpout']] * PAGE_KB
+        swap_color = "#FF6D00" if swap_in_kb > 0 or swap_out_kb > 0 else "#abb2bf"
+        self.lbl_swap_rates.setText(f"Swap In: {swap_in_kb:,.0f} KB/s | Swap Out: {swap_out_kb:,.0f} KB/s")
+        self.lbl_swap_rates.setStyleSheet(f"font-size: 16px; color: {swap_color};")
+
+        oom_kills = totals[VMSTAT_INDEX['oom_kill']]
+        new_kills = oom_kills - self.prev_oom_kills if self.prev_oom_kills is not None else 0
+        self.prev_oom_kills = oom_kills
+        oom_color = "#FF6D00" if new_kills > 0 else "#abb2bf"
+        self.lbl_oom_kills.setText(f"OOM Kills: {oom_kills:,}" + (f" (+{new_kills} this interval)" if new_kills > 0 else ""))
+        self.lbl_oom_kills.setStyleSheet(f"font-size: 16px; color: {oom_color};")
 
         # CPU Frequencies
-        core_count = len(get_per_core_cpu_usage())
         freq_text = ""
-        for i in range(core_count):
-            freq = c_lib.get_cpu_frequency(i)
+        for i, freq in enumerate(self.reader.read_frequencies()):
             if freq > 0:
                 freq_text += f"Core {i}: {freq:.0f} MHz\n"
         
@@ -880,43 +1231,82 @@ class ProfessionalMonitor(QMainWindow):
         self.prev_context_switches = current_ctxt
 
         # File Descriptors
-        allocated = ctypes.c_long()
-        max_fd = ctypes.c_long()
-        c_lib.get_file_descriptors(ctypes.byref(allocated), ctypes.byref(max_fd))
-        if max_fd.value > 0:
-            fd_percent = (allocated.value / max_fd.value) * 100
-            self.lbl_file_descriptors.setText(f"File Descriptors: {allocated.value:,} / {max_fd.value:,} ({fd_percent:.1f}%)")
+        allocated, max_fd = self.reader.read_file_descriptors()
+        if max_fd > 0:
+            fd_percent = (allocated / max_fd) * 100
+            self.lbl_file_descriptors.setText(f"File Descriptors: {allocated:,} / {max_fd:,} ({fd_percent:.1f}%)")
         else:
-            self.lbl_file_descriptors.setText(f"File Descriptors: {allocated.value:,}")
+            self.lbl_file_descriptors.setText(f"File Descriptors: {allocated:,}")
 
         # Process Counts
-        running = ctypes.c_int()
-        sleeping = ctypes.c_int()
-        stopped = ctypes.c_int()
-        zombie = ctypes.c_int()
-        c_lib.get_process_counts(ctypes.byref(running), ctypes.byref(sleeping), 
-                                ctypes.byref(stopped), ctypes.byref(zombie))
-        total = running.value + sleeping.value + stopped.value + zombie.value
+        running, sleeping, stopped, zombie = self.reader.read_process_counts()
+        total = running + sleeping + stopped + zombie
         self.lbl_process_counts.setText(
-            f"Processes: Total {total} | Running {running.value} | Sleeping {sleeping.value} | Stopped {stopped.value} | Zombie {zombie.value}"
+            f"Processes: Total {total} | Running {running} | Sleeping {sleeping} | Stopped {stopped} | Zombie {zombie}"
+        )
+
+        # Process Churn
+        source = "netlink" if self.proc_events.event_driven else "polling"
+        self.lbl_process_churn.setText(
+            f"Process Churn: {self.proc_events.spawn_rate:.1f} spawned/s | {self.proc_events.exit_rate:.1f} exited/s ({source})"
         )
+        if self.proc_events.event_driven:
+            recent = self.proc_events.recent_short_lived()
+            if recent:
+                entries = ", ".join(f"{name} ({pid}, {lifetime * 1000:.0f} ms, exit {code})"
+                                    for pid, name, lifetime, code in reversed(recent))
+                self.lbl_short_lived.setText(f"Short-lived Processes: {entries}")
+            else:
+                self.lbl_short_lived.setText("Short-lived Processes: None")
+        else:
+            self.lbl_short_lived.setText("Short-lived Processes: N/A (needs CAP_NET_ADMIN)")
 
         # Disk I/O Rates
-        for device in self.disk_devices:
-            read_mbps = ctypes.c_double()
-            write_mbps = ctypes.c_double()
-            c_lib.get_disk_io_rates(device.encode('utf-8'), ctypes.byref(read_mbps), ctypes.byref(write_mbps))
-            self.lbl_disk_io[device].setText(f"{device}: Read {read_mbps.value:.2f} MB/s | Write {write_mbps.value:.2f} MB/s")
+        disk_rates = self.reader.read_disk_io()
+        for i, device in enumerate(self.disk_devices):
+            self.lbl_disk_io[device].setText(
+                f"{device}: Read {disk_rates[i * 2]:.2f} MB/s | Write {disk_rates[i * 2 + 1]:.2f} MB/s"
+            )
+
+        # Filesystems
+        fs_lines = []
+        for m in self.mount_usages:
+            if not m.responsive:
+                fs_lines.append(f"{m.mount_point} ({m.fs_type}): not responding")
+                continue
+            warn = " ⚠" if m.percent > 90 or m.inode_percent > 90 else ""
+            inodes = f" | Inodes {m.inode_percent:.1f}%" if m.inodes_total > 0 else ""
+            fs_lines.append(
+                f"{m.mount_point} ({m.fs_type}): {m.used_bytes / 1024**3:.1f} / {m.total_bytes / 1024**3:.1f} GB "
+                f"({m.percent:.1f}%){inodes}{warn}"
+            )
+        self.lbl_filesystems.setText("\n".join(fs_lines) if fs_lines else "No filesystems found")
+
+        # Interrupts
+        self.interrupts.collect()
+        self.softirqs.collect()
+        irq_lines = []
+        for title, collector in (("IRQs", self.interrupts), ("Softirqs", self.softirqs)):
+            top = collector.top_sources(5)
+            irq_lines.append(f"Top {title}:" + ("" if top else " idle"))
+            for name, rate, cpu, cpu_rate in top:
+                irq_lines.append(f"    {name[:48]}: {rate:,.0f}/s (busiest CPU {cpu}: {cpu_rate:,.0f}/s)")
+        hot = irq_hot_spots((self.interrupts, self.softirqs), 6)
+        irq_lines.append("Hot CPUs: " + " | ".join(f"CPU {cpu}: {rate:,.0f}/s" for cpu, rate in hot))
+        self.lbl_interrupts.setText("\n".join(irq_lines))
+
+        # Hardware Sensors (self.sensors was read this tick by update_system_stats)
+        sensor_lines = []
+        for chip, sensors in group_sensors(self.sensors):
+            sensor_lines.append(f"{chip}:")
+            sensor_lines.extend(f"    {format_sensor(sensor)}" for sensor in sensors)
+        self.lbl_sensors.setText("\n".join(sensor_lines) if sensor_lines else "No hwmon sensors found")
 
         # Battery Info
-        percentage = ctypes.c_int()
-        is_charging = ctypes.c_int()
-        charge_rate = ctypes.c_double()
-        c_lib.get_battery_info(ctypes.byref(percentage), ctypes.byref(is_charging), ctypes.byref(charge_rate))
-        
-        if percentage.value >= 0:
-            status = "Charging" if is_charging.value else "Discharging"
-            self.lbl_battery.setText(f"Battery: {percentage.value}% ({status}) | Power: {charge_rate.value:.2f}W")
+        percentage, is_charging, charge_rate = self.reader.read_battery()
+        if percentage >= 0:
+            status = "Charging" if is_charging else "Discharging"
+            self.lbl_battery.setText(f"Battery: {percentage}% ({status}) | Power: {charge_rate:.2f}W")
         else:
             self.lbl_battery.setText("Battery: Not Available")
 
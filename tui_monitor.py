@@ -0,0 +1,469 @@
+"""Terminal frontend for the resource monitor, for use over SSH.
+
+Shows the same tabs as the PyQt window (overview, processes, network,
+system info) on top of the collectors module. The interactive mode uses
+curses and only rewrites the lines that changed since the previous frame;
+--batch prints plain-text snapshots for scripting.
+"""
+import argparse
+import ctypes
+import curses
+import locale
+import sys
+import time
+from collectors import (c_lib, MEMINFO_FIELDS, MEMINFO_INDEX, VMSTAT_FIELDS, VMSTAT_INDEX, PAGE_KB,
+                        get_process_list, get_process_stats, get_process_disk_io, get_per_core_cpu_usage,
+                        get_network_interfaces, get_disk_devices, format_io_rate,
+                        group_sensors, format_sensor, format_sensor_value,
+                        ProcessTree, ProcEventCollector, MountCollector, HwmonCollector,
+                        IrqCollector, IRQ_SOURCE_SOFTIRQS, irq_hot_spots, BatchReader, system_metrics)
+from alerts import AlertEngine, ALERTS_CONFIG, load_alert_config, process_metrics, format_alert, format_event
+from export import SampleExporter, EXPORT_FORMATS
+
+TABS = ("Overview", "Processes", "Network", "System Info")
+
+def bar(percent, width=20):
+    """Text progress bar, e.g. [|||||     ]."""
+    filled = int(round(min(max(percent, 0), 100) / 100 * width))
+    return "[" + "|" * filled + " " * (width - filled) + "]"
+
+def format_uptime(seconds):
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    return f"{int(h)}h {int(m)}m {int(s)}s"
+
+# --- 1. SAMPLING AND TEXT RENDERING ---
+class TerminalMonitor:
+    """Samples every collector once per tick and renders each tab as lines of text."""
+
+    def __init__(self, alert_config=ALERTS_CONFIG):
+        self.alerts = AlertEngine(*load_alert_config(alert_config))
+        self.exporter = None
+        self.alert_events = []
+        self.proc_names = {}
+        self.proc_events = ProcEventCollector()
+        self.mount_collector = MountCollector()
+        self.hwmon = HwmonCollector()
+        self.interrupts = IrqCollector()
+        self.softirqs = IrqCollector(IRQ_SOURCE_SOFTIRQS)
+        self.network_interfaces = get_network_interfaces()
+        self.disk_devices = get_disk_devices()
+        self.reader = BatchReader(self.network_interfaces, self.disk_devices)
+        self.meminfo = (ctypes.c_longlong * len(MEMINFO_FIELDS))()
+        self.vmstat_rates = (ctypes.c_double * len(VMSTAT_FIELDS))()
+        self.vmstat_totals = (ctypes.c_longlong * len(VMSTAT_FIELDS))()
+        self.prev_context_switches = 0
+        self.prev_sample_time = None
+        self.prev_oom_kills = None
+        self.tree_mode = False
+        self.process_tree = None
+
+    def toggle_tree_mode(self):
+        self.tree_mode = not self.tree_mode
+        self.process_tree = ProcessTree() if self.tree_mode else None
+
+    def sample(self):
+        # Samples are -d apart, or closer when a key forces one, so per-second
+        # values divide by the time actually elapsed
+        now = time.monotonic()
+        elapsed = now - self.prev_sample_time if self.prev_sample_time is not None else 0
+        self.prev_sample_time = now
+        self.live_pids = self.proc_events.poll()
+        if self.process_tree is not None:
+            self.process_tree.note_events(self.proc_events.spawned_pids, self.proc_events.exited_pids)
+
+        # Overview
+        self.uptime = c_lib.get_uptime_seconds()
+        self.cpu = c_lib.get_cpu_usage()
+        self.sensors = self.hwmon.collect()
+        self.package_temp = self.hwmon.package_temperature()
+        self.temp = self.package_temp.value if self.package_temp is not None else c_lib.get_cpu_temperature()
+        self.load = tuple(self.reader.read_loads())
+        self.iowait = c_lib.get_iowait_percentage()
+        c_lib.get_meminfo_fields(self.meminfo)
+        self.core_usages = get_per_core_cpu_usage()
+        self.mount_usages = self.mount_collector.collect()
+        self.interrupts.collect()
+        self.softirqs.collect()
+
+        # Processes
+        process_stats = None
+        if self.tree_mode:
+            process_stats = get_process_stats(self.live_pids)
+            self.process_tree.update(process_stats)
+        else:
+            self.processes = [
+                (pid, name, state, mem, c_lib.get_process_cpu_usage(pid), get_process_disk_io(pid),
+                 c_lib.get_process_fd_count(pid))
+                for pid, name, state, mem in get_process_list(self.live_pids)
+            ]
+
+        # Network
+        counters, rates = self.reader.read_network()
+        self.network = [
+            (iface, rates[i * 2], rates[i * 2 + 1], counters[i * 6:i * 6 + 6])
+            for i, iface in enumerate(self.network_interfaces)
+        ]
+        self.connections = c_lib.get_network_connections_count()
+
+        # System Info
+        c_lib.get_vmstat_rates(self.vmstat_rates, self.vmstat_totals)
+        oom_kills = self.vmstat_totals[VMSTAT_INDEX['oom_kill']]
+        self.new_oom_kills = oom_kills - self.prev_oom_kills if self.prev_oom_kills is not None else 0
+        self.prev_oom_kills = oom_kills
+
+        self.frequencies = self.reader.read_frequencies()
+
+        current_ctxt = c_lib.get_context_switches()
+        self.ctxt_per_sec = None
+        if self.prev_context_switches > 0 and elapsed > 0:
+            self.ctxt_per_sec = (current_ctxt - self.prev_context_switches) / elapsed
+        self.context_switches = current_ctxt
+        self.prev_context_switches = current_ctxt
+
+        self.file_descriptors = self.reader.read_file_descriptors()
+        self.process_counts = self.reader.read_process_counts()
+
+        disk_rates = self.reader.read_disk_io()
+        self.disk_io = [(device, disk_rates[i * 2], disk_rates[i * 2 + 1]) for i, device in enumerate(self.disk_devices)]
+
+        self.battery = self.reader.read_battery()
+
+        # Alerts
+        metrics = system_metrics(self.cpu, self.iowait, self.temp, self.load, self.meminfo, self.vmstat_rates,
+                                 self.file_descriptors)
+        metrics.update(self.reader.device_metrics())
+        if process_stats is None and (self.alerts.needs_processes or self.exporter is not None):
+            process_stats = get_process_stats(self.live_pids)
+        per_process, self.proc_names = None, {}
+        if self.alerts.needs_processes:
+            per_process, self.proc_names = process_metrics(process_stats)
+        self.alert_events = self.alerts.evaluate(metrics, per_process, self.proc_names)
+
+        # Export
+        if self.exporter is not None:
+            self.exporter.add(metrics, process_stats)
+
+    def render(self, tab, width):
+        lines = (self.render_overview, self.render_processes, self.render_network, self.render_system_info)[tab](width)
+        if width is None:
+            return lines
+        return [line[:width] for line in lines]
+
+    def render_overview(self, width):
+        meminfo = self.meminfo
+        total_mb = meminfo[MEMINFO_INDEX['MemTotal']] // 1024
+        available_mb = meminfo[MEMINFO_INDEX['MemAvailable']] // 1024
+        used_mb = total_mb - available_mb
+        mem_percent = used_mb / total_mb * 100 if total_mb > 0 else 0
+
+        lines = [
+            f"CPU   {bar(self.cpu)} {self.cpu:5.1f}%    Uptime: {format_uptime(self.uptime)}",
+            f"Mem   {bar(mem_percent)} {mem_percent:5.1f}%    {used_mb} / {total_mb} MB (available {available_mb} MB)",
+        ]
+
+        swap_total = meminfo[MEMINFO_INDEX['SwapTotal']]
+        swap_free = meminfo[MEMINFO_INDEX['SwapFree']]
+        if swap_total > 0:
+            swap_percent = (swap_total - swap_free) / swap_total * 100
+            lines.append(f"Swap  {bar(swap_percent)} {swap_percent:5.1f}%    "
+                         f"{(swap_total - swap_free) // 1024} / {swap_total // 1024} MB")
+        else:
+            lines.append("Swap  No Swap Available")
+
+        root = next((m for m in self.mount_usages if m.mount_point == '/'), None)
+        if root is not None:
+            lines.append(f"Disk  {bar(root.percent)} {root.percent:5.1f}%    "
+                         f"{root.used_bytes // 1024**3} / {root.total_bytes // 1024**3} GB (/)")
+
+        temp = f"{self.temp:.1f}°C" if self.temp > 0 else "N/A"
+        if self.package_temp is not None:
+            temp = format_sensor_value(self.package_temp)
+        lines.append(f"Load Avg: {self.load[0]:.2f}, {self.load[1]:.2f}, {self.load[2]:.2f} | "
+                     f"I/O Wait: {self.iowait:.2f}% | CPU Temp: {temp}")
+        active = self.alerts.active()
+        if active:
+            lines.append(f"Alerts ({len(active)} active):")
+            lines.extend(f"  ! {format_alert(rule, pid, self.proc_names.get(pid, ''), value)}"
+                         for rule, pid, value in active[:5])
+        else:
+            lines.append("Alerts: none")
+        lines.append("")
+        lines.append("Per-Core CPU Usage")
+
+        cell = "cpu{:<3} {} {:3.0f}%"
+        cell_width = len(cell.format(0, bar(0, 10), 0)) + 3
+        per_row = max(1, (width or 120) // cell_width)
+        for start in range(0, len(self.core_usages), per_row):
+            lines.append("   ".join(cell.format(i, bar(usage, 10), usage)
+                                    for i, usage in enumerate(self.core_usages[start:start + per_row], start)))
+        return lines
+
+    def render_processes(self, width):
+        if self.tree_mode:
+            lines = ["Process Tree (Subtree Totals)   [t] list view",
+                     f"{'PID':>7}  {'NAME':<40} {'S':1} {'MEM':>9} {'CPU%':>6} {'DISK I/O/s':>11}"]
+            nodes = self.process_tree.nodes
+            stack = sorted((n for n in nodes.values() if n.parent is None), key=lambda n: n.pid, reverse=True)
+            depths = {n.pid: 0 for n in stack}
+            while stack:
+                node = stack.pop()
+                depth = depths.pop(node.pid)
+                cpu, rss_kb, io_rate = node.total
+                name = ("  " * depth + node.name)[:40]
+                lines.append(f"{node.pid:>7}  {name:<40} {node.state:1} {rss_kb // 1024:>6} MB {cpu:>5.1f}% "
+                             f"{format_io_rate(io_rate):>11}")
+                children = sorted(node.children, reverse=True)
+                for child in children:
+                    depths[child] = depth + 1
+                stack.extend(nodes[child] for child in children)
+            return lines
+
+        lines = ["Top Processes (Sorted by Memory)   [t] tree view",
+                 f"{'PID':>7}  {'NAME':<24} {'S':1} {'MEM':>9} {'CPU%':>6} {'DISK I/O':>9} {'FDs':>5}"]
+        for pid, name, state, mem, cpu, disk_io, fds in self.processes:
+            lines.append(f"{pid:>7}  {name[:24]:<24} {state:1} {mem:>6} MB {cpu:>5.1f}% {disk_io:>9} {fds:>5}")
+        return lines
+
+    def render_network(self, width):
+        lines = ["Network Statistics", ""]
+        for iface, rx_mbps, tx_mbps, (rx_bytes, tx_bytes, rx_packets, tx_packets, rx_errors, tx_errors) in self.network:
+            lines.append(f"Interface: {iface}")
+            lines.append(f"  Throughput: ↓ {rx_mbps:.2f} Mbps | ↑ {tx_mbps:.2f} Mbps")
+            lines.append(f"  Packets: RX {rx_packets} | TX {tx_packets} | Errors: RX {rx_errors} | TX {tx_errors}")
+            lines.append("")
+        lines.append(f"Active Network Connections: {self.connections}")
+        return lines
+
+    def render_system_info(self, width):
+        meminfo = self.meminfo
+        rates = self.vmstat_rates
+        lines = [
+            "Memory Breakdown",
+            f"  Cached: {meminfo[MEMINFO_INDEX['Cached']] // 1024} MB | Buffers: {meminfo[MEMINFO_INDEX['Buffers']] // 1024} MB"
+            f" | Shared: {meminfo[MEMINFO_INDEX['Shmem']] // 1024} MB",
+            f"  Available: {meminfo[MEMINFO_INDEX['MemAvailable']] // 1024} MB | Free: {meminfo[MEMINFO_INDEX['MemFree']] // 1024} MB"
+            f" | Dirty: {meminfo[MEMINFO_INDEX['Dirty']] // 1024} MB",
+            f"  Page Faults: {rates[VMSTAT_INDEX['pgfault']]:,.0f}/sec | Major: {rates[VMSTAT_INDEX['pgmajfault']]:,.0f}/sec",
+            f"  Swap In: {rates[VMSTAT_INDEX['pswpin']] * PAGE_KB:,.0f} KB/s | Swap Out: {rates[VMSTAT_INDEX['pswpout']] * PAGE_KB:,.0f} KB/s",
+            f"  OOM Kills: {self.vmstat_totals[VMSTAT_INDEX['oom_kill']]:,}"
+            + (f" (+{self.new_oom_kills} this interval)" if self.new_oom_kills > 0 else ""),
+            "",
+            "CPU Frequencies",
+        ]
+
+        freqs = [f"Core {i}: {freq:.0f} MHz" for i, freq in enumerate(self.frequencies) if freq > 0]
+        if freqs:
+            for start in range(0, len(freqs), 6):
+                lines.append("  " + " | ".join(freqs[start:start + 6]))
+        else:
+            lines.append("  Frequency information not available")
+
+        lines.append("")
+        lines.append("System Statistics")
+        if self.ctxt_per_sec is not None:
+            lines.append(f"  Context Switches: {self.ctxt_per_sec:,.0f}/sec (Total: {self.context_switches:,})")
+        else:
+            lines.append(f"  Context Switches: {self.context_switches:,}")
+
+        allocated, max_fd = self.file_descriptors
+        if max_fd > 0:
+            lines.append(f"  File Descriptors: {allocated:,} / {max_fd:,} ({allocated / max_fd * 100:.1f}%)")
+        else:
+            lines.append(f"  File Descriptors: {allocated:,}")
+
+        running, sleeping, stopped, zombie = self.process_counts
+        lines.append(f"  Processes: Total {running + sleeping + stopped + zombie} | Running {running} | "
+                     f"Sleeping {sleeping} | Stopped {stopped} | Zombie {zombie}")
+
+        source = "netlink" if self.proc_events.event_driven else "polling"
+        lines.append(f"  Process Churn: {self.proc_events.spawn_rate:.1f} spawned/s | "
+                     f"{self.proc_events.exit_rate:.1f} exited/s ({source})")
+        if self.proc_events.event_driven:
+            for pid, name, lifetime, code in reversed(self.proc_events.recent_short_lived()):
+                lines.append(f"    short-lived: {name} ({pid}, {lifetime * 1000:.0f} ms, exit {code})")
+
+        lines.append("")
+        lines.append("Disk I/O Rates")
+        for device, read_mbps, write_mbps in self.disk_io:
+            lines.append(f"  {device}: Read {read_mbps:.2f} MB/s | Write {write_mbps:.2f} MB/s")
+
+        lines.append("")
+        lines.append("Filesystems")
+        for m in self.mount_usages:
+            if not m.responsive:
+                lines.append(f"  {m.mount_point} ({m.fs_type}): not responding")
+                continue
+            warn = " !" if m.percent > 90 or m.inode_percent > 90 else ""
+            inodes = f" | Inodes {m.inode_percent:.1f}%" if m.inodes_total > 0 else ""
+            lines.append(f"  {m.mount_point} ({m.fs_type}): {m.used_bytes / 1024**3:.1f} / {m.total_bytes / 1024**3:.1f} GB "
+                         f"({m.percent:.1f}%){inodes}{warn}")
+
+        lines.append("")
+        lines.append("Interrupts")
+        for title, collector in (("IRQs", self.interrupts), ("Softirqs", self.softirqs)):
+            top = collector.top_sources(5)
+            lines.append(f"  Top {title}:" + ("" if top else " idle"))
+            for name, rate, cpu, cpu_rate in top:
+                lines.append(f"    {name[:48]}: {rate:,.0f}/s (busiest CPU {cpu}: {cpu_rate:,.0f}/s)")
+        hot = irq_hot_spots((self.interrupts, self.softirqs), 6)
+        lines.append("  Hot CPUs: " + " | ".join(f"CPU {cpu}: {rate:,.0f}/s" for cpu, rate in hot))
+
+        lines.append("")
+        lines.append("Hardware Sensors")
+        for chip, sensors in group_sensors(self.sensors):
+            lines.append(f"  {chip}:")
+            lines.extend(f"    {format_sensor(sensor)}" for sensor in sensors)
+        if not self.sensors:
+            lines.append("  No hwmon sensors found")
+
+        lines.append("")
+        percentage, is_charging, charge_rate = self.battery
+        if percentage >= 0:
+            status = "Charging" if is_charging else "Discharging"
+            lines.append(f"Battery: {percentage}% ({status}) | Power: {charge_rate:.2f}W")
+        else:
+            lines.append("Battery: Not Available")
+        return lines
+
+# --- 2. INTERACTIVE (CURSES) MODE ---
+def draw_changed_lines(stdscr, prev_lines, lines, width):
+    """Writes only the lines that differ from the previous frame."""
+    for y, line in enumerate(lines):
+        if y < len(prev_lines) and prev_lines[y] == line:
+            continue
+        try:
+            # The bottom-right cell can't be written without scrolling, so stop one short
+            stdscr.addnstr(y, 0, line, width - 1, curses.A_BOLD if y == 0 else curses.A_NORMAL)
+            stdscr.clrtoeol()
+        except curses.error:
+            pass
+
+def run_interactive(stdscr, monitor, delay):
+    try:
+        curses.curs_set(0)
+    except curses.error:
+        pass
+    stdscr.timeout(100)
+
+    tab = 0
+    scroll = 0
+    prev_lines = []
+    next_sample = 0
+    body = []
+    redraw = True
+
+    while True:
+        now = time.monotonic()
+        if now >= next_sample:
+            monitor.sample()
+            next_sample = now + delay
+            redraw = True
+
+        if redraw:
+            height, width = stdscr.getmaxyx()
+            body = monitor.render(tab, width - 1)
+            scroll = max(0, min(scroll, len(body) - (height - 3)))
+            tab_bar = "  ".join(f"[{i + 1} {name}]" if i == tab else f" {i + 1} {name} " for i, name in enumerate(TABS))
+            lines = [tab_bar, "-" * (width - 1)] + body[scroll:scroll + height - 3]
+            lines += [""] * (height - 1 - len(lines))
+            lines.append("q quit | 1-4/Tab switch tab | ↑↓ PgUp PgDn scroll | t tree view")
+            draw_changed_lines(stdscr, prev_lines, lines, width)
+            prev_lines = lines
+            stdscr.noutrefresh()
+            curses.doupdate()
+            redraw = False
+
+        key = stdscr.getch()
+        if key == -1:
+            continue
+        redraw = True
+        if key in (ord('q'), ord('Q')):
+            return
+        elif ord('1') <= key <= ord('4'):
+            tab, scroll = key - ord('1'), 0
+        elif key in (ord('\t'), curses.KEY_RIGHT):
+            tab, scroll = (tab + 1) % len(TABS), 0
+        elif key in (curses.KEY_BTAB, curses.KEY_LEFT):
+            tab, scroll = (tab - 1) % len(TABS), 0
+        elif key == curses.KEY_DOWN:
+            scroll += 1
+        elif key == curses.KEY_UP:
+            scroll = max(0, scroll - 1)
+        elif key == curses.KEY_NPAGE:
+            scroll += stdscr.getmaxyx()[0] - 3
+        elif key == curses.KEY_PPAGE:
+            scroll = max(0, scroll - (stdscr.getmaxyx()[0] - 3))
+        elif key == curses.KEY_HOME:
+            scroll = 0
+        elif key in (ord('t'), ord('T')):
+            monitor.toggle_tree_mode()
+            scroll = 0
+            next_sample = 0
+        elif key == curses.KEY_RESIZE:
+            # Everything moved; repaint the whole screen once
+            prev_lines = []
+            stdscr.clear()
+
+# --- 3. BATCH MODE ---
+def parse_tabs(text):
+    """argparse type for --tabs: comma-separated 1-based tab numbers."""
+    try:
+        tabs = [int(t) - 1 for t in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated numbers, got {text!r}")
+    for tab in tabs:
+        if not 0 <= tab < len(TABS):
+            raise argparse.ArgumentTypeError(f"tab {tab + 1} is out of range (1-{len(TABS)})")
+    return tabs
+
+def run_batch(monitor, iterations, delay, tabs):
+    # Rates and CPU percentages need a previous sample to diff against
+    monitor.sample()
+    for i in range(iterations):
+        time.sleep(delay)
+        monitor.sample()
+        print(f"=== {time.strftime('%Y-%m-%d %H:%M:%S')} (iteration {i + 1}/{iterations}) ===")
+        for event in monitor.alert_events:
+            print(format_event(event))
+        for tab in tabs:
+            print(f"--- {TABS[tab]} ---")
+            print("\n".join(monitor.render(tab, None)))
+        print()
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Terminal Linux System Resource Monitor")
+    parser.add_argument("-b", "--batch", action="store_true", help="print snapshots instead of the interactive UI")
+    parser.add_argument("-n", "--iterations", type=int, default=1, help="number of snapshots in batch mode")
+    parser.add_argument("-d", "--delay", type=float, default=1.0, help="seconds between updates")
+    parser.add_argument("--tabs", type=parse_tabs, default="1,2,3,4", help="comma-separated tabs to print in batch mode (1-4)")
+    parser.add_argument("--tree", action="store_true", help="start the process tab in tree view")
+    parser.add_argument("--alerts", default=ALERTS_CONFIG, help="alert rules and sinks file (default: %(default)s)")
+    parser.add_argument("--export", metavar="DIR", help="record every sample to system and processes tables in DIR")
+    parser.add_argument("--export-format", choices=EXPORT_FORMATS, default="csv",
+                        help="file format for --export (parquet needs pyarrow)")
+    args = parser.parse_args()
+
+    monitor = TerminalMonitor(args.alerts)
+    if args.tree:
+        monitor.toggle_tree_mode()
+    if args.export:
+        try:
+            monitor.exporter = SampleExporter(args.export, args.export_format,
+                                              device_columns=monitor.reader.device_metrics())
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+
+    try:
+        if args.batch:
+            try:
+                run_batch(monitor, args.iterations, args.delay, args.tabs)
+            except (KeyboardInterrupt, BrokenPipeError):
+                pass
+        else:
+            locale.setlocale(locale.LC_ALL, '')
+            curses.wrapper(run_interactive, monitor, args.delay)
+    finally:
+        if monitor.exporter is not None:
+            monitor.exporter.close()